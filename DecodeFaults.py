@@ -8,6 +8,8 @@ import automation1 as a1
 import logging
 import os
 
+from Globals import AUTOMATION1_DIR
+
 class decode_faults:
     def __init__(self, faults_per_axis, connected_axes, controller: a1.Controller, fault_log):
         self.faults_per_axis = faults_per_axis
@@ -18,8 +20,7 @@ class decode_faults:
             logger = logging.getLogger(controller.name)
             logger.setLevel(logging.ERROR)
             if not logger.handlers:
-                username = os.getlogin()
-                logs_dir = os.path.join(f"C:\\Users\\{username}\\Documents\\Automation1")
+                logs_dir = AUTOMATION1_DIR
                 if not os.path.exists(logs_dir):
                     os.makedirs(logs_dir)
                 log_file_path = os.path.join(logs_dir, f"{controller.name}_faults.log")
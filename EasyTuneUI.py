@@ -13,6 +13,7 @@ import threading
 import queue
 import sys
 import os
+import logging
 from datetime import datetime
 import contextlib
 from io import StringIO
@@ -1048,6 +1049,8 @@ def center_window(root, width=900, height=700):
 
 def main():
     """Main function to run the UI"""
+    # Show the full parameter-apply detail from RunEasyTune in the output pane
+    logging.getLogger("EasyTune").setLevel(logging.DEBUG)
     root = tk.Tk()
     
     # Set window icon and other properties
@@ -7,6 +7,9 @@ DEFAULT_DIRECTORY = os.path.dirname(os.path.realpath(__file__)) + "\\"
 VERSION_FILE = DEFAULT_DIRECTORY + "version_project.txt"
 DEFAULT_FILE = "New Response.fr"
 
+# Automation1 user directory, resolved once (os.getlogin() fails under runas/scheduled tasks)
+AUTOMATION1_DIR = os.path.join(os.path.expanduser("~"), "Documents", "Automation1")
+
 #region Resources
 RESOURCE_DIRECTORY = DEFAULT_DIRECTORY + "Resources\\"
 FONT_DIRECTORY = RESOURCE_DIRECTORY + "Barlow/"
@@ -30,11 +30,12 @@ OPTIMIZATION_TARGET_RANGE_MIN = -3
 OPTIMIZATION_TARGET_RANGE_MAX = +3
 
 class Easy_Tune_Module():
-    def __init__(self, gui:Ui_MainWindow=None, block_layout_module:Block_Explorer_Module=None):
+    def __init__(self, gui:Ui_MainWindow=None, block_layout_module:Block_Explorer_Module=None, log_file=None):
         self.is_headless = gui is None
         self.gui = gui
         self.block_layout_module = block_layout_module
         self.active_thread = None
+        self._done = threading.Event()  # Set by the EasyTune thread when it finishes
         self.did_easy_tune_succeed = False
         self.servo_controller = None
         self.zip_directory = None
@@ -43,6 +44,7 @@ class Easy_Tune_Module():
         self.results = None  # Store analysis results
         self.original_frd = None
         self.results_filepath = None  # Store path to results file
+        self.log_file = log_file  # Stream for console messages (None = sys.stdout)
 
         # Only setup GUI components if gui is provided
         if gui is not None:
@@ -147,6 +149,7 @@ class Easy_Tune_Module():
                 raise ValueError("fr_filepath is required when running without block_layout_module")
             if self.active_thread is None:
                 self.fr_filepath = fr_filepath
+                self._done.clear()
                 self.active_thread = threading.Thread(target=self.easy_tune_thread)
                 self.active_thread.start()
                 
@@ -156,6 +159,7 @@ class Easy_Tune_Module():
                 if self.block_layout_module.primary_block_layout is not None:
                     # Get FR filepath from block layout if not provided
                     self.fr_filepath = fr_filepath or self.block_layout_module.primary_block_layout.filename
+                    self._done.clear()
                     self.active_thread = threading.Thread(target=self.easy_tune_thread)
                     self.active_thread.start()
                 else:
@@ -290,30 +294,30 @@ class Easy_Tune_Module():
         if not (hasattr(self, 'fr_filepath') and self.fr_filepath):
             raise ValueError("No FR file provided")
         
-        print(f"Reading FR file: {self.fr_filepath}")
+        print(f"Reading FR file: {self.fr_filepath}", file=self.log_file)
         [version, a1_data] = a1_interface.read_frequency_response_result_from_a1_file(self.fr_filepath)
         
         # Print a1_data details for debugging
-        print("\nLoaded FR Data:")
-        print(f"Version: {version}")
+        print("\nLoaded FR Data:", file=self.log_file)
+        print(f"Version: {version}", file=self.log_file)
         
         block_layout_with_data = Block_Layout_With_Data(
             a1_data=a1_data, 
             filename=self.fr_filepath
         )
 
-        print("\nAttempting EasyTune optimization...")
+        print("\nAttempting EasyTune optimization...", file=self.log_file)
         [self.did_easy_tune_succeed, self.servo_controller, 
          number_of_generations, optimization_time_ms, 
          self.zip_directory, self.exception] = \
             a1_interface.run_easy_tune(block_layout_with_data.shaped, block_layout_with_data.a1_data, verification=self.verification, performance_target=self.performance_target)
         
         
-        print("\nEasyTune Results:")
-        print(f"Success: {self.did_easy_tune_succeed}")
-        print(f"Generations: {number_of_generations}")
-        print(f"Time: {optimization_time_ms/1000:.2f}s")
-        print(f"Logs: {self.zip_directory}")
+        print("\nEasyTune Results:", file=self.log_file)
+        print(f"Success: {self.did_easy_tune_succeed}", file=self.log_file)
+        print(f"Generations: {number_of_generations}", file=self.log_file)
+        print(f"Time: {optimization_time_ms/1000:.2f}s", file=self.log_file)
+        print(f"Logs: {self.zip_directory}", file=self.log_file)
         
         return self.did_easy_tune_succeed, block_layout_with_data, number_of_generations, optimization_time_ms
 
@@ -662,14 +666,14 @@ class Easy_Tune_Module():
         
         # Write results to file instead of printing
         self.results_filepath = self.write_results_to_file(results, block_layout_with_data)
-        print(f"\nAnalysis complete. Results written to: {self.results_filepath}")
+        print(f"\nAnalysis complete. Results written to: {self.results_filepath}", file=self.log_file)
         
         return results, original_frd
 
     def easy_tune_thread(self) -> None:
         """The actual EasyTune thread to run when started."""
         try:
-            print("\nStarting EasyTune thread...")
+            print("\nStarting EasyTune thread...", file=self.log_file)
             self.set_thread_state(True)
 
             try:
@@ -680,25 +684,33 @@ class Easy_Tune_Module():
                 self.results, self.original_frd = self.analyze_easy_tune_results(block_layout_with_data)
                     
             except Exception as e:
-                print(f"Error during optimization: {str(e)}")
+                print(f"Error during optimization: {str(e)}", file=self.log_file)
                 import traceback
-                traceback.print_exc()
+                traceback.print_exc(file=self.log_file)
                 self.exception = e
                 self.did_easy_tune_succeed = False
                 return
 
         except Exception as e:
-            print(f"Error in EasyTune thread: {str(e)}")
-            print("\nFull traceback:")
+            print(f"Error in EasyTune thread: {str(e)}", file=self.log_file)
+            print("\nFull traceback:", file=self.log_file)
             import traceback
-            traceback.print_exc()
+            traceback.print_exc(file=self.log_file)
             self.exception = e
             self.did_easy_tune_succeed = False
             
         finally:
-            print("EasyTune thread completed")
+            print("EasyTune thread completed", file=self.log_file)
             self.set_thread_state(False)
             self.active_thread = None
+            self._done.set()
+
+    def wait_for_completion(self, timeout=None) -> bool:
+        """Block until the EasyTune thread finishes.
+        
+        Returns: True if the thread completed, False if the timeout expired first
+        """
+        return self._done.wait(timeout)
 
     def get_results(self) -> dict:
         """Get the analysis results after EasyTune completion.
@@ -707,11 +719,11 @@ class Easy_Tune_Module():
             tuple: (results_dict, original_frd) or (None, None) if not available
         """
         if not hasattr(self, 'results') or self.results is None:
-            print("⚠️ Warning: No results available - EasyTune may not have completed successfully")
+            print("⚠️ Warning: No results available - EasyTune may not have completed successfully", file=self.log_file)
             return None, None
             
         if not hasattr(self, 'original_frd') or self.original_frd is None:
-            print("⚠️ Warning: No original FRD available - analysis may have failed")
+            print("⚠️ Warning: No original FRD available - analysis may have failed", file=self.log_file)
             return self.results, None
             
         return self.results, self.original_frd
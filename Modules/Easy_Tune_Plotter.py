@@ -11,7 +11,6 @@ from plotly.subplots import make_subplots
 import plotly.offline as pyo
 from datetime import datetime
 import pandas as pd
-from pathlib import Path
 import json
 import math
 
@@ -21,14 +20,16 @@ class EasyTunePlotter:
     similar to the existing UI but standalone for the RunEasyTune.py program
     """
     
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, log_file=None):
         """
         Initialize the EasyTune plotter
         
         Args:
             output_dir: Directory to save plots (default: current directory)
+            log_file: Stream for status messages (default: sys.stdout)
         """
         self.output_dir = output_dir or os.getcwd()
+        self.log_file = log_file
         self.fr_files = []
         self.log_files = []
         self.stability_data = []
@@ -78,7 +79,7 @@ class EasyTunePlotter:
             }
             return fr_data
         except Exception as e:
-            print(f"Error loading FR file {fr_filepath}: {e}")
+            print(f"Error loading FR file {fr_filepath}: {e}", file=self.log_file)
             return None
 
     def parse_log_file(self, log_filepath):
@@ -155,7 +156,7 @@ class EasyTunePlotter:
             stability_data['stability_passed'] = '🎉 OVERALL ASSESSMENT: PASS' in content
 
         except Exception as e:
-            print(f"Error parsing log file {log_filepath}: {e}")
+            print(f"Error parsing log file {log_filepath}: {e}", file=self.log_file)
 
         return stability_data
 
@@ -296,7 +297,7 @@ class EasyTunePlotter:
         output_filename = f"Bode Plot_{axis}_{position}.html"
         output_path = os.path.join(self.output_dir, output_filename)
         pyo.plot(fig, filename=output_path, auto_open=False)
-        print(f"📊 Bode plot saved to: {output_path}")
+        print(f"📊 Bode plot saved to: {output_path}", file=self.log_file)
         
         return fig
 
@@ -309,11 +310,13 @@ class EasyTunePlotter:
             output_filename: Name for output HTML file
         """
         if log_files is None:
-            # Search for log files in output directory
-            log_files = list(Path(self.output_dir).glob("*.log"))
+            # Search for log files in output directory (DirEntry caches the stat from the directory read)
+            with os.scandir(self.output_dir) as entries:
+                log_entries = [entry for entry in entries if entry.name.endswith('.log') and entry.is_file()]
+            log_files = [entry.path for entry in sorted(log_entries, key=lambda entry: entry.stat().st_mtime)]
         
         if not log_files:
-            print("No log files found for stability analysis")
+            print("No log files found for stability analysis", file=self.log_file)
             return None
         
         # Parse all log files
@@ -324,7 +327,7 @@ class EasyTunePlotter:
                 stability_data.append(data)
         
         if not stability_data:
-            print("No valid stability data found in log files")
+            print("No valid stability data found in log files", file=self.log_file)
             return None
         
         if not output_filename:
@@ -634,7 +637,7 @@ class EasyTunePlotter:
         # Save plot
         output_path = os.path.join(self.output_dir, output_filename)
         pyo.plot(fig, filename=output_path, auto_open=True)
-        print(f"📊 Stability analysis plot saved to: {output_path}")
+        print(f"📊 Stability analysis plot saved to: {output_path}", file=self.log_file)
         
         return fig
 
@@ -646,11 +649,11 @@ class EasyTunePlotter:
             fr_files: List of .fr file paths
             log_files: List of log file paths
         """
-        print("🎯 Creating Combined EasyTune Analysis...")
+        print("🎯 Creating Combined EasyTune Analysis...", file=self.log_file)
         
         # Create stability analysis if log files provided/found
         stability_fig = self.create_stability_analysis_plot(log_files)
         if stability_fig:
-            print("✅ Stability analysis created")
+            print("✅ Stability analysis created", file=self.log_file)
         
-        print(f"📁 All plots saved to: {self.output_dir}")
\ No newline at end of file
+        print(f"📁 All plots saved to: {self.output_dir}", file=self.log_file)
\ No newline at end of file
@@ -8,6 +8,9 @@ Created on Thu Mar 28 14:14:27 2024
 import automation1 as a1
 import sys
 import contextlib
+import copy
+import io
+import logging
 import os
 import re
 import json
@@ -15,18 +18,47 @@ import subprocess
 import time
 import numpy as np
 #import serial.tools.list_ports
-import tkinter as tk
 from tkinter import messagebox, filedialog
 from DecodeFaults import decode_faults
+from Globals import AUTOMATION1_DIR
 import math
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import plotly.offline as pyo
 from datetime import datetime
-import tempfile
 import zipfile
-import xml.etree.ElementTree as ET
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+
+# Numba is optional - fall back to plain Python when it is not installed
+# Kernels use @njit without signatures so they compile on first call (cached on disk), never at import
+NUMBA_AVAILABLE = False
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# lxml is optional - its C parser/serializer is much faster for the MCD XML files; ElementTree is the fallback
+LXML_AVAILABLE = False
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# orjson is optional - when installed, Plotly serializes figures and NumPy arrays with it in C
+try:
+    import orjson  # noqa: F401
+    import plotly.io as pio
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
 
 from Modules.Easy_Tune_Module import Easy_Tune_Module
 from Modules.Easy_Tune_Plotter import EasyTunePlotter
@@ -39,6 +71,26 @@ from GenerateMCD_v2 import AerotechController
 global so_dir
 so_dir = None
 
+# Remembers which transport connected last time (see connect())
+CONNECTION_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".easytune_conn.json")
+
+class StdoutLogHandler(logging.Handler):
+    """Write log records to whatever sys.stdout is at emit time, so the UI and log-file redirects still see them"""
+    def emit(self, record):
+        try:
+            sys.stdout.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
+
+# Parameter/filter apply and stability report output. The level is left to the application (EasyTuneUI
+# and the command line set DEBUG for every per-parameter line); INFO drops that detail, WARNING keeps problems only.
+logger = logging.getLogger("EasyTune")
+if not logger.handlers:
+    _stdout_handler = StdoutLogHandler()
+    _stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_stdout_handler)
+    logger.propagate = False
+
 def check_stop_signal(stop_event):
     """Check if stop was requested and raise exception if so"""
     if stop_event and stop_event.is_set():
@@ -68,19 +120,69 @@ def cleanup_mcd_files(base_name, dir_path):
     
     print("✅ MCD file cleanup completed")
 
-def modify_controller_name(mcd_path, mode="Loaded"):
-    # Use system temp directory with write permissions
-    temp_dir = tempfile.mkdtemp(prefix="mcd_extract_")
+def read_mcd_entry(mcd_path, entry_name):
+    """Return the bytes of one file inside an MCD archive, or None if the archive does not contain it"""
+    with zipfile.ZipFile(mcd_path, 'r') as zip_ref:
+        try:
+            return zip_ref.read(entry_name)
+        except KeyError:
+            return None
+
+# zlib level for rewritten MCD entries; the MCD is uploaded and discarded, so favour speed over size
+MCD_COMPRESS_LEVEL = 1
+# Chunk size for streaming unchanged entries between archives
+MCD_COPY_BUFFER_SIZE = 64 * 1024
+
+def write_mcd_entries(mcd_path, new_mcd_path, replacements):
+    """
+    Copy an MCD archive entry by entry, replacing the contents of the named entries
+
+    Unchanged entries are streamed from the source file in fixed-size chunks, keeping
+    their compression type and timestamps. The new archive is written to a temporary
+    file next to the destination and moved into place only once it is complete, so
+    new_mcd_path may be the same as mcd_path.
 
+    Args:
+        mcd_path: Source MCD file
+        new_mcd_path: Destination MCD file
+        replacements: Dictionary of {archive entry name: new bytes}
+    """
+    temp_path = new_mcd_path + '.tmp'
     try:
-        # Extract the original MCD
-        with zipfile.ZipFile(mcd_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
+        with zipfile.ZipFile(mcd_path, 'r') as src, \
+             zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=MCD_COMPRESS_LEVEL) as dst:
+            for zip_info in src.infolist():
+                # Entries keep their own ZipInfo, so the level must be passed per entry as well
+                if zip_info.filename in replacements:
+                    dst.writestr(zip_info, replacements[zip_info.filename], compresslevel=MCD_COMPRESS_LEVEL)
+                    continue
+                # Stream unchanged entries through a fixed-size buffer instead of reading them whole.
+                # Writing updates the offsets and CRC on the ZipInfo, so give the destination its own copy
+                with src.open(zip_info) as source_entry, dst.open(copy.copy(zip_info), 'w') as dest_entry:
+                    shutil.copyfileobj(source_entry, dest_entry, MCD_COPY_BUFFER_SIZE)
+        os.replace(temp_path, new_mcd_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def mcd_xml_bytes(root, standalone=False):
+    """Serialize an MCD XML root element with its XML declaration"""
+    if LXML_AVAILABLE:
+        return ET.tostring(root, encoding='utf-8', xml_declaration=True, standalone=True if standalone else None)
+    if standalone:
+        # ElementTree cannot write standalone="yes", so build the declaration by hand
+        return b'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n' + ET.tostring(root, encoding='utf-8', xml_declaration=False)
+    return ET.tostring(root, encoding='utf-8', xml_declaration=True)
+
+# ControllerName suffix patterns, compiled once
+NO_LOAD_PATTERN = re.compile(r'no[\s\-]*load', re.IGNORECASE)
+NO_LOAD_SUFFIX_PATTERN = re.compile(r'[\s\-]*no[\s\-]*load[\s\-]*', re.IGNORECASE)
 
-        name_path = os.path.join(temp_dir, "config", "Names")
-        if os.path.exists(name_path):
-            name_tree = ET.parse(name_path)
-            name_root = name_tree.getroot()
+def modify_controller_name(mcd_path, mode="Loaded"):
+    try:
+        names_xml = read_mcd_entry(mcd_path, "config/Names")
+        if names_xml is not None:
+            name_root = ET.fromstring(names_xml)
 
             # Find the ControllerName element
             controller_name_elem = name_root.find(".//ControllerName")
@@ -88,52 +190,67 @@ def modify_controller_name(mcd_path, mode="Loaded"):
                 current_name = controller_name_elem.text.strip()
                 if mode.lower() == "no load":
                     # If "No Load" not present, add it
-                    if re.search(r'no[\s\-]*load', current_name, flags=re.IGNORECASE):
+                    if NO_LOAD_PATTERN.search(current_name):
                         new_text = current_name
                     else:
                         new_text = current_name + " No Load"
                 else:  # mode == "Loaded"
                     # Replace any "No Load" with "Loaded", or add "Loaded" if not present
-                    new_text = re.sub(r'[\s\-]*no[\s\-]*load[\s\-]*', ' Loaded', current_name, flags=re.IGNORECASE)
+                    new_text = NO_LOAD_SUFFIX_PATTERN.sub(' Loaded', current_name)
                     if 'Loaded' not in new_text:
                         new_text = new_text.strip() + ' Loaded'
                 controller_name_elem.text = new_text.strip()
                 print(f"Updated ControllerName: {controller_name_elem.text}")
 
-                # Save the modified Names file
-                name_tree.write(name_path, encoding='utf-8', xml_declaration=True)
+                # Save the modified Names file back into the MCD
+                write_mcd_entries(mcd_path, mcd_path, {"config/Names": mcd_xml_bytes(name_root)})
             else:
                 print("ControllerName element not found or empty in Names file.")
-
-        # Create new MCD file
-        with zipfile.ZipFile(mcd_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, temp_dir)
-                    new_zip.write(file_path, arcname)
     except Exception as e:
         print(f"❌ Error modifying MCD: {str(e)}")
         return None
 
+# <P ... n="EnabledTasks">value</P> in config/Parameters, with the integer value captured
+ENABLED_TASKS_PATTERN = re.compile(rb'<P\b[^>]*\bn="EnabledTasks"[^>]*>\s*(\d+)\s*</P>')
+
 def modify_mcd_enabled_tasks(mcd_path):
     """Modifies the MCD file to ensure EnabledTasks is set correctly"""
-    # Use system temp directory with write permissions
-    temp_dir = tempfile.mkdtemp(prefix="mcd_extract_")
-    
-    # Ask user to select source MCD file
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    
     if not mcd_path:
         print("❌ No MCD file selected")
         return None
 
-    # Create a backup copy first
     dir_path = os.path.dirname(mcd_path)
     base_name = os.path.splitext(os.path.basename(mcd_path))[0]
+
+    # Check the current value before writing anything
+    try:
+        params_xml = read_mcd_entry(mcd_path, "config/Parameters")
+    except Exception as e:
+        print(f"❌ Error reading MCD: {str(e)}")
+        return None
+
+    # Later steps (payload update, upload) write to the returned MCD, so it is always a -modified copy
+    new_mcd_path = os.path.join(dir_path, f"{base_name}-modified.mcd")
+
+    # Common case: EnabledTasks already holds an integer, so it can be checked and patched without parsing
+    enabled_tasks_match = ENABLED_TASKS_PATTERN.search(params_xml) if params_xml is not None else None
+    if params_xml is None or (enabled_tasks_match is not None and int(enabled_tasks_match.group(1)) > 2):
+        # Nothing to change - a plain copy is enough, and the original is never written so no backup is needed
+        if params_xml is None:
+            print("⚠️ Parameters not found in MCD, EnabledTasks left unchanged")
+        else:
+            print("✅ EnabledTasks already set, no change needed")
+        try:
+            shutil.copy2(mcd_path, new_mcd_path)
+        except Exception as e:
+            print(f"❌ Error copying MCD: {str(e)}")
+            return None
+        print(f"✅ Modified MCD saved as: {new_mcd_path}")
+        return new_mcd_path, base_name, dir_path
+
+    # Create a backup copy first
     backup_path = os.path.join(dir_path, f"{base_name}-backup.mcd")
-    
+
     try:
         print(f"📑 Creating backup of original MCD...")
         shutil.copy2(mcd_path, backup_path)
@@ -141,26 +258,18 @@ def modify_mcd_enabled_tasks(mcd_path):
     except Exception as e:
         print(f"❌ Failed to create backup: {str(e)}")
         return None  # Don't proceed if we can't create a backup
-    
-    # Create a new filename for the modified MCD
-    new_mcd_path = os.path.join(dir_path, f"{base_name}-modified.mcd")
-    
-    # Clean up any existing temp directory
-    if os.path.exists(temp_dir):
-        shutil.rmtree(temp_dir)
-    os.makedirs(temp_dir)
-    
-    try:
-        # Extract the original MCD
-        with zipfile.ZipFile(mcd_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
 
+    try:
         # Modify the Parameters file
-        params_path = os.path.join(temp_dir, "config", "Parameters")
-        if os.path.exists(params_path):
-            tree = ET.parse(params_path)
-            root = tree.getroot()
-            
+        replacements = {}
+        if enabled_tasks_match is not None:
+            # Existing integer value <= 2 - replace the digits in place
+            replacements["config/Parameters"] = (params_xml[:enabled_tasks_match.start(1)] + b"4"
+                                                 + params_xml[enabled_tasks_match.end(1):])
+        else:
+            # EnabledTasks is missing or not an integer - edit the parsed tree
+            root = ET.fromstring(params_xml)
+
             # Find or create the System section
             params = root.find(".//Parameters")
             if params is None:
@@ -168,14 +277,13 @@ def modify_mcd_enabled_tasks(mcd_path):
                 if data is None:
                     data = ET.SubElement(root, "Data")
                 params = ET.SubElement(data, "Parameters")
-            
+
             system = params.find("System")
             if system is None:
                 system = ET.SubElement(params, "System")
-            
+
             # Check if EnabledTasks already exists
             enabled_tasks = system.find('.//P[@n="EnabledTasks"]')
-            needs_update = False
 
             if enabled_tasks is None:
                 # Add EnabledTasks parameter if it doesn't exist
@@ -184,76 +292,56 @@ def modify_mcd_enabled_tasks(mcd_path):
                 enabled_tasks.set("n", "EnabledTasks")
                 needs_update = True
             else:
-                # Check if the value is missing or <= 2
-                try:
-                    value = int(enabled_tasks.text.strip())
-                    if value <= 2:
-                        needs_update = True
-                except (TypeError, ValueError, AttributeError):
-                    # If text is missing or not an integer, update it
-                    needs_update = True
+                # Update if the value is missing, not an integer, or <= 2
+                text = (enabled_tasks.text or '').strip()
+                needs_update = not text.isdigit() or int(text) <= 2
 
             if needs_update:
                 enabled_tasks.text = "4"
-                
+
                 # Save the modified Parameters file with proper XML declaration
-                xml_str = '<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
-                tree_str = ET.tostring(root, encoding='unicode')
-                if tree_str.startswith('<?xml'):
-                    tree_str = tree_str[tree_str.find('?>')+2:]
-                with open(params_path, 'w', encoding='utf-8') as f:
-                    f.write(xml_str + tree_str)
-        
+                replacements["config/Parameters"] = mcd_xml_bytes(root, standalone=True)
+
         # Create new MCD file
-        with zipfile.ZipFile(new_mcd_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-            # Walk through the temporary directory and add all files
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, temp_dir)
-                    new_zip.write(file_path, arcname)
-        
+        write_mcd_entries(mcd_path, new_mcd_path, replacements)
+
         print(f"✅ Modified MCD saved as: {new_mcd_path}")
         return new_mcd_path, base_name, dir_path
-        
+
     except Exception as e:
         print(f"❌ Error modifying MCD: {str(e)}")
         return None
-    
-    finally:
-        # Clean up
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
-            
+
+def compile_mcd_path(path):
+    """Return a function that finds every element matching path, compiled once as an XPath under lxml"""
+    if LXML_AVAILABLE:
+        return ET.XPath(path)
+    return lambda element: element.findall(path)
+
+# MachineSetupData paths used to locate each axis's stage component
+MSD_MECHANICAL_AXES_PATH = compile_mcd_path(".//MachineSetupConfiguration/MechanicalProducts/MechanicalProduct/MechanicalAxes/MechanicalAxis")
+MSD_LINEAR_STAGE_PATH = compile_mcd_path("./Stage/LinearStageComponent")
+MSD_ROTARY_STAGE_PATH = compile_mcd_path("./Stage/RotaryStageComponent")
+
 def modify_mcd_payloads(mcd_path, payload_values):
     """
-    Unpack the MCD, update LoadMass/LoadInertia in config/MachineSetupData for each axis in payload_values (order matters).
+    Update LoadMass/LoadInertia in the MCD's config/MachineSetupData for each axis in payload_values (order matters).
     Only updates if payload is nonzero.
     """
-    import tempfile
-
-    temp_dir = tempfile.mkdtemp(prefix="mcd_extract_")
     try:
-        # Extract the MCD
-        with zipfile.ZipFile(mcd_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-
-        msd_path = os.path.join(temp_dir, "config", "MachineSetupData")
-        if not os.path.exists(msd_path):
+        msd_xml = read_mcd_entry(mcd_path, "config/MachineSetupData")
+        if msd_xml is None:
             print("❌ MachineSetupData not found in MCD")
             return None
 
-        tree = ET.parse(msd_path)
-        root = tree.getroot()
+        root = ET.fromstring(msd_xml)
 
         # Find all Stage components in order
         stages = []
-        for mech_axis in root.findall(".//MachineSetupConfiguration/MechanicalProducts/MechanicalProduct/MechanicalAxes/MechanicalAxis"):
-            stage = mech_axis.find("./Stage/LinearStageComponent")
-            if stage is None:
-                stage = mech_axis.find("./Stage/RotaryStageComponent")
-            if stage is not None:
-                stages.append(stage)
+        for mech_axis in MSD_MECHANICAL_AXES_PATH(root):
+            stage = MSD_LINEAR_STAGE_PATH(mech_axis) or MSD_ROTARY_STAGE_PATH(mech_axis)
+            if stage:
+                stages.append(stage[0])
 
         # Get payload values in order
         payload_keys = list(payload_values.keys())
@@ -283,24 +371,14 @@ def modify_mcd_payloads(mcd_path, payload_values):
             print("No LoadMass or LoadInertia fields updated.")
             return None
 
-        # Save the modified MachineSetupData
-        tree.write(msd_path, encoding='utf-8', xml_declaration=True)
-
-        # Repack the MCD
-        with zipfile.ZipFile(mcd_path, 'w', zipfile.ZIP_DEFLATED) as new_zip:
-            for root_dir, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root_dir, file)
-                    arcname = os.path.relpath(file_path, temp_dir)
-                    new_zip.write(file_path, arcname)
+        # Save the modified MachineSetupData back into the MCD
+        write_mcd_entries(mcd_path, mcd_path, {"config/MachineSetupData": mcd_xml_bytes(root)})
         print(f"✅ Payloads updated and new MCD saved as: {mcd_path}")
         return mcd_path
 
     except Exception as e:
         print(f"❌ Error modifying MCD payloads: {e}")
         return None
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
 
 def upload_mcd_to_controller(controller, mdk_path):
     """Uploads an MCD file to the controller"""
@@ -340,8 +418,7 @@ def download_mcd_from_controller(controller, mdk_path):
         
 def get_file_directory(controller_name):
     """Create and return the directory path for file storage based on SO number"""
-    username = os.getlogin()
-    base_dir = os.path.join(f"C:\\Users\\{username}\\Documents\\Automation1")
+    base_dir = AUTOMATION1_DIR
     
     # Extract SO number (first 6 digits) from controller name
     so_number = controller_name[:6]
@@ -349,110 +426,136 @@ def get_file_directory(controller_name):
     # Create SO directory path
     so_dir = os.path.join(base_dir, f"SO_{so_number}")
     
-    # Create directory if it doesn't exist
-    if not os.path.exists(so_dir):
-        os.makedirs(so_dir)
-        print(f"📁 Created directory for SO {so_number}")
-    if not os.path.exists(os.path.join(so_dir, 'Performance Analysis')):
-        os.makedirs(os.path.join(so_dir, 'Performance Analysis'), exist_ok=True)
+    # Create the SO and Performance Analysis directories if they don't exist (one check when they do)
+    performance_dir = os.path.join(so_dir, 'Performance Analysis')
+    if not os.path.isdir(performance_dir):
+        os.makedirs(performance_dir, exist_ok=True)
         print(f"📁 Created Performance Analysis directory for SO {so_number}")
     
     return so_dir
 
+# Axis name in an FR filename (test-{axis}-...)
+FR_AXIS_PATTERN = re.compile(r"test-([A-Za-z]+)-")
+
 def extract_axis_from_fr_filepath(fr_filepath):
     """
     Extracts the axis name from a frequency response file path.
     Assumes filename format: test-{axis}-{position}.fr or test-{axis}-{position}-Verification.fr
     """
     filename = os.path.basename(fr_filepath)
-    match = re.match(r"test-([A-Za-z]+)-", filename)
+    match = FR_AXIS_PATTERN.match(filename)
     if match:
         return match.group(1)
     else:
         return None
 
+def _probe_axes(controller):
+    """
+    Discover the physically connected (non-virtual) axes on a controller.
+
+    Returns:
+        tuple: (connected_axes, non_virtual_axes) where connected_axes maps axis name to index
+    """
+    connected_axes = {}
+
+    number_of_axes = controller.runtime.parameters.axes.count
+    axis_range = range(0, 11) if number_of_axes <= 12 else range(0, 32)
+
+    # Query every axis status in a single status request
+    status_item_configuration = a1.StatusItemConfiguration()
+    for axis_index in axis_range:
+        status_item_configuration.axis.add(a1.AxisStatusItem.AxisStatus, axis_index)
+    result = controller.runtime.status.get_status_items(status_item_configuration)
+
+    # Test the connected bit (13) of every status at once; only connected axes have their names looked up
+    axis_statuses = np.fromiter((int(result.axis.get(a1.AxisStatusItem.AxisStatus, axis_index).value) for axis_index in axis_range),
+                                dtype=np.int64, count=len(axis_range))
+    for position in np.flatnonzero((axis_statuses >> 13) & 1):
+        axis_index = axis_range[position]
+        connected_axes[controller.runtime.parameters.axes[axis_index].identification.axisname.value] = axis_index
+
+    non_virtual_axes = list(connected_axes)
+
+    return connected_axes, non_virtual_axes
+
+def load_cached_connection_type():
+    """Return the transport ('usb' or 'hyperwire') that last connected successfully, or None"""
+    try:
+        with open(CONNECTION_CACHE_PATH, 'r') as f:
+            return json.load(f).get('type')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def save_cached_connection_type(connection_type):
+    """Remember the transport that connected successfully so the next run tries it first"""
+    try:
+        with open(CONNECTION_CACHE_PATH, 'w') as f:
+            json.dump({'type': connection_type}, f)
+    except OSError as e:
+        print(f"⚠️ Could not save connection type: {e}")
+
+def _start_controller(connection_type):
+    """Connect over 'usb' or 'hyperwire' and start the controller"""
+    controller = a1.Controller.connect_usb() if connection_type == 'usb' else a1.Controller.connect()
+    controller.start()
+    return controller
+
 def connect(connection_type=None):
     global controller, non_virtual_axes, connected_axes
     
+    # Set when the cached USB attempt already failed, so the fallbacks below don't repeat it
+    usb_failed = False
+    if connection_type is None and load_cached_connection_type() == 'usb':
+        # Last run connected over USB - try it first to skip the Hyperwire timeout
+        usb_controller = None
+        try:
+            usb_controller = _start_controller('usb')
+            connected_axes, non_virtual_axes = _probe_axes(usb_controller)
+            if len(non_virtual_axes) > 0:
+                controller = usb_controller
+                return controller, non_virtual_axes
+            print("ℹ️ Cached USB connection found no axes, probing Hyperwire")
+        except Exception as e:
+            print(f"ℹ️ Cached USB connection failed ({e}), probing Hyperwire")
+        usb_failed = True
+        if usb_controller is not None:
+            # Release the USB session before opening Hyperwire
+            try:
+                usb_controller.disconnect()
+            except Exception as e:
+                print(f"⚠️ Could not disconnect the USB controller: {e}")
+
+    active_connection_type = connection_type if connection_type else 'hyperwire'
+
     if connection_type is None:
         try:
-            controller = a1.Controller.connect()
-            controller.start()
+            controller = _start_controller('hyperwire')
         except:
-            if messagebox.askyesno('Could Not Connect To Hyperwire', 'Is this an iDrive?'):
+            if usb_failed:
+                messagebox.showerror('Connection Error', 'Check connections and try again')
+            elif messagebox.askyesno('Could Not Connect To Hyperwire', 'Is this an iDrive?'):
                 try:
-                    controller = a1.Controller.connect_usb()
-                    controller.start()
+                    controller = _start_controller('usb')
+                    active_connection_type = 'usb'
                 except:
                     messagebox.showerror('Connection Error', 'Check connections and try again')
             else:
                 messagebox.showerror('Connection Error', 'Check Firmware version and try again')
-    if connection_type == 'usb':
-        try:
-            controller = a1.Controller.connect_usb()
-            controller.start()
-        except:
-            messagebox.showerror('Connection Error', 'Check connections and try again')
-    if connection_type == 'hyperwire':
+    else:
         try:
-            controller = a1.Controller.connect()
-            controller.start()
+            controller = _start_controller(connection_type)
         except:
             messagebox.showerror('Connection Error', 'Check connections and try again')
 
-    connected_axes = {}
-    non_virtual_axes = []
-
-    number_of_axes = controller.runtime.parameters.axes.count
-
-    if number_of_axes <= 12:
-        for axis_index in range(0,11):
-            status_item_configuration = a1.StatusItemConfiguration()
-            status_item_configuration.axis.add(a1.AxisStatusItem.AxisStatus, axis_index)
-            
-            result = controller.runtime.status.get_status_items(status_item_configuration)
-            axis_status = int(result.axis.get(a1.AxisStatusItem.AxisStatus, axis_index).value)
-            if (axis_status & 1 << 13) > 0:
-                connected_axes[controller.runtime.parameters.axes[axis_index].identification.axisname.value] = axis_index
-        for key, value in connected_axes.items():
-            non_virtual_axes.append(key)
-    else:
-        for axis_index in range(0,32):
-            status_item_configuration = a1.StatusItemConfiguration()
-            status_item_configuration.axis.add(a1.AxisStatusItem.AxisStatus, axis_index)
-            result = controller.runtime.status.get_status_items(status_item_configuration)
-            axis_status = int(result.axis.get(a1.AxisStatusItem.AxisStatus, axis_index).value)
-            if (axis_status & 1 << 13) > 0:
-                connected_axes[controller.runtime.parameters.axes[axis_index].identification.axisname.value] = axis_index
-        for key, value in connected_axes.items():
-
-            non_virtual_axes.append(key)
-    if len(non_virtual_axes) == 0:
-        #try:
-        controller = a1.Controller.connect_usb()
-        number_of_axes = controller.runtime.parameters.axes.count
-        if number_of_axes <= 12:
-            for axis_index in range(0,11):
-                status_item_configuration = a1.StatusItemConfiguration()
-                status_item_configuration.axis.add(a1.AxisStatusItem.AxisStatus, axis_index)
-                
-                result = controller.runtime.status.get_status_items(status_item_configuration)
-                axis_status = int(result.axis.get(a1.AxisStatusItem.AxisStatus, axis_index).value)
-                if (axis_status & 1 << 13) > 0:
-                    connected_axes[controller.runtime.parameters.axes[axis_index].identification.axisname.value] = axis_index
-            for key, value in connected_axes.items():
-                non_virtual_axes.append(key)
-        else:
-            for axis_index in range(0,32):
-                status_item_configuration = a1.StatusItemConfiguration()
-                status_item_configuration.axis.add(a1.AxisStatusItem.AxisStatus, axis_index)
-                result = controller.runtime.status.get_status_items(status_item_configuration)
-                axis_status = int(result.axis.get(a1.AxisStatusItem.AxisStatus, axis_index).value)
-                if (axis_status & 1 << 13) > 0:
-                    connected_axes[controller.runtime.parameters.axes[axis_index].identification.axisname.value] = axis_index
-            for key, value in connected_axes.items():
+    connected_axes, non_virtual_axes = _probe_axes(controller)
+    if len(non_virtual_axes) == 0 and not usb_failed:
+        # No axes found - fall back to USB, starting the new connection before probing it
+        controller = _start_controller('usb')
+        active_connection_type = 'usb'
+        connected_axes, non_virtual_axes = _probe_axes(controller)
 
-                non_virtual_axes.append(key)
+    if len(non_virtual_axes) > 0:
+        save_cached_connection_type(active_connection_type)
 
     return controller, non_virtual_axes    #messagebox.showerror('No Device', 'No Devices Present. Check Connections.')
 
@@ -479,6 +582,30 @@ def get_limit_dec(controller, axis, limit=None):
 
     return electrical_limit_value
 
+def set_fault_mask_limits(controller, axes, limit):
+    """
+    Apply a get_limit_dec limit toggle to the FaultMask of every axis
+    """
+    for axis in axes:
+        electrical_limit_value = get_limit_dec(controller, axis, limit)
+        controller.runtime.parameters.axes[axis].protection.faultmask.value = electrical_limit_value
+
+# Per-axis signals collected by data_config
+DATA_CONFIG_AXIS_SIGNALS = (
+    a1.AxisDataSignal.DriveStatus,
+    a1.AxisDataSignal.AxisFault,
+    a1.AxisDataSignal.PrimaryFeedback,
+    a1.AxisDataSignal.PositionFeedback,
+    a1.AxisDataSignal.VelocityFeedback,
+    a1.AxisDataSignal.AccelerationFeedback,
+    a1.AxisDataSignal.AccelerationCommand,
+    a1.AxisDataSignal.PositionError,
+    a1.AxisDataSignal.CurrentCommand,
+    a1.AxisDataSignal.CurrentFeedback,
+    a1.AxisDataSignal.VelocityCommand,
+    a1.AxisDataSignal.PositionCommand,
+)
+
 def data_config(n: int, freq: a1.DataCollectionFrequency, axis: int=None, axes: list=None) -> a1.DataCollectionConfiguration:
     """
     Data configurations. These are how to configure data collection parameters
@@ -489,50 +616,25 @@ def data_config(n: int, freq: a1.DataCollectionFrequency, axis: int=None, axes:
     # Add items to collect data on the entire system
     data_config.system.add(a1.SystemDataSignal.DataCollectionSampleTime)
 
-    if axes:
-        for axis in axes:
-            # Add items to collect data on the specified axis
-            data_config.axis.add(a1.AxisDataSignal.DriveStatus, axis)
-            data_config.axis.add(a1.AxisDataSignal.AxisFault, axis)
-            data_config.axis.add(a1.AxisDataSignal.PrimaryFeedback, axis)
-            data_config.axis.add(a1.AxisDataSignal.PositionFeedback, axis)
-            data_config.axis.add(a1.AxisDataSignal.VelocityFeedback, axis)
-            data_config.axis.add(a1.AxisDataSignal.AccelerationFeedback, axis)
-            data_config.axis.add(a1.AxisDataSignal.AccelerationCommand, axis)
-            data_config.axis.add(a1.AxisDataSignal.PositionError, axis)
-            data_config.axis.add(a1.AxisDataSignal.CurrentCommand, axis)
-            data_config.axis.add(a1.AxisDataSignal.CurrentFeedback, axis)
-            data_config.axis.add(a1.AxisDataSignal.VelocityCommand, axis)
-            data_config.axis.add(a1.AxisDataSignal.PositionCommand, axis)
-            data_config.axis.add(a1.AxisDataSignal.CurrentFeedback, axis)
-    if axis:
+    # A single axis may be axis 0, so test it against None rather than truthiness
+    axes_list = axes if axes else ([axis] if axis is not None else [])
+    for axis in axes_list:
         # Add items to collect data on the specified axis
-        data_config.axis.add(a1.AxisDataSignal.DriveStatus, axis)
-        data_config.axis.add(a1.AxisDataSignal.AxisFault, axis)
-        data_config.axis.add(a1.AxisDataSignal.PrimaryFeedback, axis)
-        data_config.axis.add(a1.AxisDataSignal.PositionFeedback, axis)
-        data_config.axis.add(a1.AxisDataSignal.VelocityFeedback, axis)
-        data_config.axis.add(a1.AxisDataSignal.AccelerationFeedback, axis)
-        data_config.axis.add(a1.AxisDataSignal.AccelerationCommand, axis)
-        data_config.axis.add(a1.AxisDataSignal.PositionError, axis)
-        data_config.axis.add(a1.AxisDataSignal.CurrentCommand, axis)
-        data_config.axis.add(a1.AxisDataSignal.CurrentFeedback, axis)
-        data_config.axis.add(a1.AxisDataSignal.VelocityCommand, axis)
-        data_config.axis.add(a1.AxisDataSignal.PositionCommand, axis)
-        data_config.axis.add(a1.AxisDataSignal.CurrentFeedback, axis)
+        for signal in DATA_CONFIG_AXIS_SIGNALS:
+            data_config.axis.add(signal, axis)
 
     return data_config
 
 def check_for_faults(controller: a1.Controller, axes=None):
     faults = {}  # Initialize an empty dictionary to store results per axis
     
+    # Query every axis fault in a single status request
+    status_item_configuration = a1.StatusItemConfiguration()
     for axis in axes:
-        status_item_configuration = a1.StatusItemConfiguration()
         status_item_configuration.axis.add(a1.AxisStatusItem.AxisFault, axis)
-        
-        # Get the results for the current axis
-        results = controller.runtime.status.get_status_items(status_item_configuration)
-        
+    results = controller.runtime.status.get_status_items(status_item_configuration)
+    
+    for axis in axes:
         # Extract the axis fault status as an integer
         axis_faults = int(results.axis.get(a1.AxisStatusItem.AxisFault, axis).value)
         # Store the axis_faults in the faults dictionary with the axis as the key
@@ -540,67 +642,113 @@ def check_for_faults(controller: a1.Controller, axes=None):
         
     return faults
 
-def calculate_lowpass_coefficients(cutoff_freq, sample_freq):
+def poll_faults(controller: a1.Controller, axes=None):
+    """
+    Check the given axes for faults, decoding and logging them only when one is present
+    
+    Returns:
+        dict: Decoded fault names per axis, or None if no axis is faulted
+    """
+    axis_faults = check_for_faults(controller, axes)
+    if not any(axis_faults.values()):
+        return None
+    fault_init = decode_faults(axis_faults, axes, controller, fault_log = None)
+    return fault_init.get_fault()
+
+# Butterworth damping term used by the lowpass filter (sqrt(2) / 2)
+SQRT2_OVER_2 = math.sqrt(2.0) / 2.0
+
+@njit(cache=True)
+def calculate_lowpass_coefficients(cutoff_freqs, sample_freq):
     """
-    Calculate Low Pass filter coefficients based on AerLowPass.m
+    Calculate Low Pass filter coefficients based on AerLowPass.m for a batch of filters
     
     Args:
-        cutoff_freq: Cutoff frequency in Hz
+        cutoff_freqs: Array of cutoff frequencies in Hz
         sample_freq: Sample frequency in Hz
         
     Returns:
-        tuple: (N_coefficients, D_coefficients) where each is a list of 3 values
+        tuple: (N_coefficients, D_coefficients) arrays of shape (n_filters, 3)
     """
-    dC = 2 * math.atan(math.pi * cutoff_freq / sample_freq)
-    dD = (1.0 - math.sqrt(2.0) / 2.0 * math.sin(dC)) / (1.0 + math.sqrt(2.0) / 2.0 * math.sin(dC))
+    dC = 2 * np.arctan(np.pi * cutoff_freqs / sample_freq)
+    sin_dC = np.sin(dC)
+    dD = (1.0 - SQRT2_OVER_2 * sin_dC) / (1.0 + SQRT2_OVER_2 * sin_dC)
     
     # Denominator coefficients
-    D = [1.0, 
-         -(1 + dD) * math.cos(dC), 
-         dD]
+    D = np.empty((len(cutoff_freqs), 3))
+    D[:, 0] = 1.0
+    D[:, 1] = -(1 + dD) * np.cos(dC)
+    D[:, 2] = dD
     
     # Numerator coefficients
-    N_1 = (1 + D[1] + D[2]) / 4.0
-    N = [N_1, 
-         2 * N_1, 
-         N_1]
+    N_1 = (1 + D[:, 1] + D[:, 2]) / 4.0
+    N = np.empty((len(cutoff_freqs), 3))
+    N[:, 0] = N_1
+    N[:, 1] = 2 * N_1
+    N[:, 2] = N_1
     
     return N, D
 
-def calculate_notch_coefficients(center_freq, width, depth, sample_freq):
+@njit(cache=True)
+def calculate_notch_coefficients(center_freqs, widths, depths, sample_freq):
     """
-    Calculate Notch filter coefficients based on AerNotch.m
+    Calculate Notch filter coefficients based on AerNotch.m for a batch of filters
     
     Args:
-        center_freq: Center frequency in Hz
-        width: Width parameter
-        depth: Depth in dB
+        center_freqs: Array of center frequencies in Hz
+        widths: Array of width parameters
+        depths: Array of depths in dB
         sample_freq: Sample frequency in Hz
         
     Returns:
-        tuple: (N_coefficients, D_coefficients) where each is a list of 3 values
+        tuple: (N_coefficients, D_coefficients) arrays of shape (n_filters, 3)
     """
     dT = 1.0 / sample_freq
-    dWidth = width * 2 * math.pi
-    dWC = 2 / dT * math.tan(center_freq * math.pi * dT)
-    dDelta = 10 ** (-depth / 20.0)
-    dAlpha = (dWidth / dWC) + math.sqrt((dWidth / dWC) * (dWidth / dWC) + 1)
-    dZeta = math.sqrt((dAlpha + 1 / dAlpha - 2) / (4 * abs(1 - 2 * dDelta * dDelta)))
-    
-    dA_0 = 4 + dWC * dWC * dT * dT + 4 * dZeta * dWC * dT
+    dWidth = widths * 2 * np.pi
+    pi_dT = np.pi * dT
+    dWC = 2 / dT * np.tan(center_freqs * pi_dT)
+    dDelta = 10 ** (-depths / 20.0)
+    dAlpha = (dWidth / dWC) + np.sqrt((dWidth / dWC) * (dWidth / dWC) + 1)
+    dZeta = np.sqrt((dAlpha + 1 / dAlpha - 2) / (4 * np.abs(1 - 2 * dDelta * dDelta)))
+    
+    # Shared products, computed once
+    wcT = dWC * dT
+    wcT2 = wcT * wcT
+    zwcT = dZeta * wcT
+    dzwcT = dDelta * zwcT
+    dA_0 = 4 + wcT2 + 4 * zwcT
     
     # Denominator coefficients
-    D = [1.0,
-         (-8 + 2 * dWC * dWC * dT * dT) / dA_0,
-         (-4 * dZeta * dWC * dT + 4 + dWC * dWC * dT * dT) / dA_0]
+    D = np.empty((len(center_freqs), 3))
+    D[:, 0] = 1.0
+    D[:, 1] = (-8 + 2 * wcT2) / dA_0
+    D[:, 2] = (-4 * zwcT + 4 + wcT2) / dA_0
     
-    # Numerator coefficients  
-    N = [(4 + dWC * dWC * dT * dT + 4 * dDelta * dZeta * dWC * dT) / dA_0,
-         (-8 + 2 * dWC * dWC * dT * dT) / dA_0,
-         (-4 * dDelta * dZeta * dWC * dT + 4 + dWC * dWC * dT * dT) / dA_0]
+    # Numerator coefficients
+    N = np.empty((len(center_freqs), 3))
+    N[:, 0] = (4 + wcT2 + 4 * dzwcT) / dA_0
+    N[:, 1] = D[:, 1]
+    N[:, 2] = (-4 * dzwcT + 4 + wcT2) / dA_0
     
     return N, D
 
+# Filter type -> (batch coefficient function, ordered parameter names passed before the sample frequency)
+FILTER_COEFFICIENT_HANDLERS = {
+    'Low_Pass': (calculate_lowpass_coefficients, ('Cutoff Frequency',)),
+    'Notch': (calculate_notch_coefficients, ('Center Frequency', 'Width', 'Depth')),
+}
+
+def freeze_filter_data(data):
+    """Recursively convert filter dicts/lists into hashable tuples"""
+    if isinstance(data, dict):
+        return tuple((key, freeze_filter_data(value)) for key, value in data.items())
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze_filter_data(value) for value in data)
+    return data
+
+# Inputs and result of the previous convert_filters_to_coefficients call
+_last_filter_conversion = {'key': None, 'result': None}
+
 def convert_filters_to_coefficients(shaped_params, sample_freq=None):
     """
     Convert shaped filter parameters to coefficients for controller application
@@ -610,7 +758,9 @@ def convert_filters_to_coefficients(shaped_params, sample_freq=None):
         sample_freq: Sample frequency in Hz (default 20kHz for typical servo systems)
         
     Returns:
-        dict: Filter coefficients organized by filter type and index
+        dict: Per filter group, a dictionary of parallel per-filter lists ('indices', 'types',
+              'parameters', 'errors') and a contiguous (n_filters, 6) float64 'coeffs' array
+              with columns N0, N1, N2, D0, D1, D2 (NaN rows for unsupported filters)
     """
     filter_coefficients = {}
     
@@ -625,122 +775,101 @@ def convert_filters_to_coefficients(shaped_params, sample_freq=None):
         print("No filter data found in shaped parameters")
         return filter_coefficients
     
+    # Skip the whole conversion when the filters are identical to the previous call
+    try:
+        conversion_key = (sample_freq, freeze_filter_data(shaped_params['Filters']))
+        hash(conversion_key)
+    except TypeError:
+        conversion_key = None
+    if conversion_key is not None and conversion_key == _last_filter_conversion['key']:
+        return _last_filter_conversion['result']
+    
+    # First pass: lay out each group's filter table and gather each type's parameters by group
+    pending = {filter_type: {} for filter_type in FILTER_COEFFICIENT_HANDLERS}
     for filter_group, filter_data in shaped_params['Filters'].items():
         if 'filters' not in filter_data:
             continue
-            
-        filter_coefficients[filter_group] = {}
         
         # Handle both list (old format) and dict (new format with preserved indices)
         filters = filter_data['filters']
-        if isinstance(filters, dict):
-            # New format: dict with original indices as keys
-            for original_index, filter_info in filters.items():
-                filter_type = filter_info['type']
-                parameters = filter_info['parameters']
-                
-                if filter_type == 'Low_Pass':
-                    cutoff_freq = parameters['Cutoff Frequency']
-                    N, D = calculate_lowpass_coefficients(cutoff_freq, sample_freq)
-                    
-                    filter_coefficients[filter_group][original_index] = {  # Use original index
-                        'type': 'Low_Pass',
-                        'parameters': parameters,
-                        'numerator': N,
-                        'denominator': D
-                    }
-                    
-                elif filter_type == 'Notch':
-                    center_freq = parameters['Center Frequency']
-                    width = parameters['Width']
-                    depth = parameters['Depth']
-                    N, D = calculate_notch_coefficients(center_freq, width, depth, sample_freq)
-                    
-                    filter_coefficients[filter_group][original_index] = {  # Use original index
-                        'type': 'Notch',
-                        'parameters': parameters,
-                        'numerator': N,
-                        'denominator': D
-                    }
-                    
-                else:
-                    print(f"  Unsupported filter type: {filter_type}")
-                    filter_coefficients[filter_group][original_index] = {
-                        'type': filter_type,
-                        'parameters': parameters,
-                        'numerator': None,
-                        'denominator': None,
-                        'error': f"Unsupported filter type: {filter_type}"
-                    }
-        else:
-            # Old format: list (for backwards compatibility)
-            for i, filter_info in enumerate(filters):
-                filter_type = filter_info['type']
-                parameters = filter_info['parameters']
+        items = filters.items() if isinstance(filters, dict) else enumerate(filters)
+
+        group = {
+            'indices': [],
+            'types': [],
+            'parameters': [],
+            'errors': [],
+            'coeffs': np.full((len(filters), 6), np.nan)
+        }
+        filter_coefficients[filter_group] = group
+
+        for row, (filter_index, filter_info) in enumerate(items):
+            filter_type = filter_info['type']
+            parameters = filter_info['parameters']
+            group['indices'].append(filter_index)
+            group['types'].append(filter_type)
+            group['parameters'].append(parameters)
+            
+            if filter_type in FILTER_COEFFICIENT_HANDLERS:
+                _, parameter_names = FILTER_COEFFICIENT_HANDLERS[filter_type]
+                rows, parameter_rows = pending[filter_type].setdefault(filter_group, ([], []))
+                rows.append(row)
+                parameter_rows.append([parameters[name] for name in parameter_names])
+                group['errors'].append(None)
                 
-                if filter_type == 'Low_Pass':
-                    cutoff_freq = parameters['Cutoff Frequency']
-                    N, D = calculate_lowpass_coefficients(cutoff_freq, sample_freq)
-                    
-                    filter_coefficients[filter_group][i] = {
-                        'type': 'Low_Pass',
-                        'parameters': parameters,
-                        'numerator': N,
-                        'denominator': D
-                    }
-                    
-                elif filter_type == 'Notch':
-                    center_freq = parameters['Center Frequency']
-                    width = parameters['Width']
-                    depth = parameters['Depth']
-                    N, D = calculate_notch_coefficients(center_freq, width, depth, sample_freq)
-                    
-                    filter_coefficients[filter_group][i] = {
-                        'type': 'Notch',
-                        'parameters': parameters,
-                        'numerator': N,
-                        'denominator': D
-                    }
-                    
-                else:
-                    print(f"  Unsupported filter type: {filter_type}")
-                    filter_coefficients[filter_group][i] = {
-                        'type': filter_type,
-                        'parameters': parameters,
-                        'numerator': None,
-                        'denominator': None,
-                        'error': f"Unsupported filter type: {filter_type}"
-                    }
+            else:
+                print(f"  Unsupported filter type: {filter_type}")
+                group['errors'].append(f"Unsupported filter type: {filter_type}")
+    
+    # Second pass: one vectorized coefficient calculation per filter type, scattered into each group's rows
+    for filter_type, group_rows in pending.items():
+        if not group_rows:
+            continue
+        calculate_coefficients, _ = FILTER_COEFFICIENT_HANDLERS[filter_type]
+        parameter_rows = [parameters for _, group_parameters in group_rows.values() for parameters in group_parameters]
+        N, D = calculate_coefficients(*np.array(parameter_rows, dtype=np.float64).T, float(sample_freq))
+        start = 0
+        for filter_group, (rows, _) in group_rows.items():
+            stop = start + len(rows)
+            coeffs = filter_coefficients[filter_group]['coeffs']
+            coeffs[rows, :3] = N[start:stop]
+            coeffs[rows, 3:] = D[start:stop]
+            start = stop
+    
+    if conversion_key is not None:
+        _last_filter_conversion['key'] = conversion_key
+        _last_filter_conversion['result'] = filter_coefficients
     
     return filter_coefficients
 
 def extract_shaped_parameters(results):
     """Extract all shaped parameter values from EasyTune results"""
-    shaped_params = {}
-    
     # Extract shaped gain values
-    if 'Gains' in results:
-        for param_name, param_data in results['Gains'].items():
-            if 'shaped' in param_data:
-                shaped_params[param_name] = param_data['shaped']
+    shaped_params = {param_name: param_data['shaped']
+                     for param_name, param_data in results.get('Gains', {}).items() if 'shaped' in param_data}
     
     # Extract shaped filter configurations
     if 'Filters' in results:
-        shaped_params['Filters'] = {}
-        for filter_type, filter_data in results['Filters'].items():
-            if 'shaped' in filter_data:
-                shaped_params['Filters'][filter_type] = filter_data['shaped']
+        shaped_params['Filters'] = {filter_type: filter_data['shaped']
+                                    for filter_type, filter_data in results['Filters'].items() if 'shaped' in filter_data}
     
     # Extract enhanced tracking parameters
     if 'Enhanced_Tracking' in results:
-        shaped_params['Enhanced_Tracking'] = {}
-        for tracking_param, tracking_data in results['Enhanced_Tracking'].items():
-            if 'shaped' in tracking_data:
-                shaped_params['Enhanced_Tracking'][tracking_param] = tracking_data['shaped']
+        shaped_params['Enhanced_Tracking'] = {tracking_param: tracking_data['shaped']
+                                              for tracking_param, tracking_data in results['Enhanced_Tracking'].items() if 'shaped' in tracking_data}
     
     return shaped_params
 
-def apply_filter_coefficients_to_controller(axis, filter_coefficients, controller):
+# Zero-padded filter indices (00-12) and the coefficient parameter names for each index
+FILTER_INDEX_STRINGS = tuple(f"{i:02d}" for i in range(13))
+SERVO_FILTER_COEFF_ATTRS = tuple(
+    tuple(f'servoloopfilter{idx}coeff{c}' for c in ('n0', 'n1', 'n2', 'd1', 'd2')) for idx in FILTER_INDEX_STRINGS
+)
+FEEDFORWARD_FILTER_COEFF_ATTRS = tuple(
+    tuple(f'feedforwardfilter{idx}coeff{c}' for c in ('n0', 'n1', 'n2', 'd1', 'd2')) for idx in FILTER_INDEX_STRINGS
+)
+
+def apply_filter_coefficients_to_controller(axis, filter_coefficients, controller, configured_parameters=None):
     """
     Apply the calculated filter coefficients to the controller
     
@@ -748,372 +877,402 @@ def apply_filter_coefficients_to_controller(axis, filter_coefficients, controlle
         axis: Axis name
         filter_coefficients: Dictionary of calculated filter coefficients
         controller: Controller object
+        configured_parameters: Optional configuration already fetched by the caller. The coefficients are
+                               written into it and the caller is responsible for set_configuration.
         
     Returns:
         bool: Success status
     """
     try:
-        configured_parameters = controller.configuration.parameters.get_configuration()
+        push_configuration = configured_parameters is None
+        if push_configuration:
+            configured_parameters = controller.configuration.parameters.get_configuration()
+        servo_cfg = configured_parameters.axes[axis].servo
+        # Parameter names listed by the servo object; hasattr is only needed for names it does not list
+        servo_attrs = set(dir(servo_cfg))
         servo_filter_indices = []  # Collect all servo filter indices
         
-        for filter_group, filters in filter_coefficients.items():
-            print(f"\nApplying {filter_group} coefficients to axis {axis}")
+        for filter_group, group in filter_coefficients.items():
+            logger.info("\nApplying %s coefficients to axis %s", filter_group, axis)
+            
+            # Coefficient parameter names and log label for this group's filters
+            if filter_group == 'Servo_Filters':
+                coeff_attrs, filter_label = SERVO_FILTER_COEFF_ATTRS, 'ServoLoopFilter'
+            elif filter_group == 'Feedforward_Filters':
+                coeff_attrs, filter_label = FEEDFORWARD_FILTER_COEFF_ATTRS, 'FeedforwardFilter'
+            else:
+                coeff_attrs, filter_label = None, None
             
-            for filter_index, filter_data in filters.items():
-                if filter_data['numerator'] is None or filter_data['denominator'] is None:
-                    print(f"  Skipping Filter {filter_index}: {filter_data.get('error', 'No coefficients')}")
+            # Unpack each coefficient row once - the automation1 API has no bulk coefficient setter
+            for filter_index, error, (n0, n1, n2, _, d1, d2) in zip(group['indices'], group['errors'], group['coeffs'].tolist()):
+                if error is not None:
+                    logger.debug("  Skipping Filter %s: %s", filter_index, error)
                     continue
                 
                 # Ensure filter index is within valid range (0-12)
                 if filter_index > 12:
-                    print(f"  ⚠️  Filter index {filter_index} exceeds maximum (12), skipping...")
+                    logger.warning("  ⚠️  Filter index %s exceeds maximum (12), skipping...", filter_index)
                     continue
                 
-                N = filter_data['numerator']
-                D = filter_data['denominator']
-                filter_type = filter_data['type']
+                if coeff_attrs is None:
+                    continue
+                
+                # Filter index with leading zero (00, 01, 02, ..., 12)
+                filter_idx_str = FILTER_INDEX_STRINGS[filter_index]
                 
-                # Format filter index with leading zero (00, 01, 02, ..., 12)
-                filter_idx_str = f"{filter_index:02d}"
+                # Check every parameter exists before setting any, so a missing one leaves the filter untouched
+                coeff_names = coeff_attrs[filter_index]
+                missing = [name for name in coeff_names if name not in servo_attrs and not hasattr(servo_cfg, name)]
+                if missing:
+                    logger.error("    ❌ %s%s parameters not found: %s", filter_label, filter_idx_str, ', '.join(missing))
+                    continue
+                n0_param, n1_param, n2_param, d1_param, d2_param = [getattr(servo_cfg, name) for name in coeff_names]
+                
+                # Set the values
+                n0_param.value = n0
+                n1_param.value = n1
+                n2_param.value = n2
+                d1_param.value = d1
+                d2_param.value = d2
                 
                 if filter_group == 'Servo_Filters':
-                    # Apply servo loop filter coefficients dynamically
-                    try:
-                        # Get the parameter objects dynamically
-                        n0_param = getattr(configured_parameters.axes[axis].servo, f'servoloopfilter{filter_idx_str}coeffn0')
-                        n1_param = getattr(configured_parameters.axes[axis].servo, f'servoloopfilter{filter_idx_str}coeffn1')
-                        n2_param = getattr(configured_parameters.axes[axis].servo, f'servoloopfilter{filter_idx_str}coeffn2')
-                        d1_param = getattr(configured_parameters.axes[axis].servo, f'servoloopfilter{filter_idx_str}coeffd1')
-                        d2_param = getattr(configured_parameters.axes[axis].servo, f'servoloopfilter{filter_idx_str}coeffd2')
-                        
-                        # Set the values
-                        n0_param.value = N[0]
-                        n1_param.value = N[1]
-                        n2_param.value = N[2]
-                        d1_param.value = D[1]
-                        d2_param.value = D[2]
-                        
-                        # Collect this servo filter index
-                        servo_filter_indices.append(filter_index)
-                        
-                        print(f"    ✅ Applied to ServoLoopFilter{filter_idx_str}")
-                        
-                    except AttributeError as e:
-                        print(f"    ❌ ServoLoopFilter{filter_idx_str} parameters not found: {e}")
-                        continue
-                        
-                elif filter_group == 'Feedforward_Filters':
-                    # Apply feedforward filter coefficients dynamically
-                    try:
-                        # Get the parameter objects dynamically (assuming similar naming pattern)
-                        n0_param = getattr(configured_parameters.axes[axis].servo, f'feedforwardfilter{filter_idx_str}coeffn0')
-                        n1_param = getattr(configured_parameters.axes[axis].servo, f'feedforwardfilter{filter_idx_str}coeffn1')
-                        n2_param = getattr(configured_parameters.axes[axis].servo, f'feedforwardfilter{filter_idx_str}coeffn2')
-                        d1_param = getattr(configured_parameters.axes[axis].servo, f'feedforwardfilter{filter_idx_str}coeffd1')
-                        d2_param = getattr(configured_parameters.axes[axis].servo, f'feedforwardfilter{filter_idx_str}coeffd2')
-                        
-                        # Set the values
-                        n0_param.value = N[0]
-                        n1_param.value = N[1]
-                        n2_param.value = N[2]
-                        d1_param.value = D[1]
-                        d2_param.value = D[2]
-                        
-                        print(f"    ✅ Applied to FeedforwardFilter{filter_idx_str}")
-                        
-                    except AttributeError as e:
-                        print(f"    ❌ FeedforwardFilter{filter_idx_str} parameters not found: {e}")
-                        continue
+                    # Collect this servo filter index
+                    servo_filter_indices.append(filter_index)
+                
+                logger.debug("    ✅ Applied to %s%s", filter_label, filter_idx_str)
         
         # Now calculate and set the servo filter bitmask OUTSIDE the loop
         if servo_filter_indices:
-            filter_setup_bitmask = 0
-            print(f"\n🔧 Enabling servo filters at indices: {servo_filter_indices}")
-            
-            for filter_index in servo_filter_indices:
-                filter_setup_bitmask |= (1 << filter_index)
-                print(f"  Adding filter {filter_index} to bitmask: bit {filter_index} = {1 << filter_index}")
-            
-            print(f"🔧 Final servoloopfiltersetup bitmask: {filter_setup_bitmask} (binary: {bin(filter_setup_bitmask)})")
-            configured_parameters.axes[axis].servo.servoloopfiltersetup.value = float(filter_setup_bitmask)
+            # Indices are unique within the servo group, so summing the bits is the same as OR-ing them
+            filter_setup_bitmask = sum(1 << filter_index for filter_index in servo_filter_indices)
+            logger.info("\n🔧 Enabling servo filters at indices %s - servoloopfiltersetup bitmask: %s (binary: %s)", servo_filter_indices, filter_setup_bitmask, bin(filter_setup_bitmask))
+            servo_cfg.servoloopfiltersetup.value = float(filter_setup_bitmask)
         else:
-            print("🔧 No servo filters to enable")
-            configured_parameters.axes[axis].servo.servoloopfiltersetup.value = 0.0
+            logger.info("🔧 No servo filters to enable")
+            servo_cfg.servoloopfiltersetup.value = 0.0
         
-        # Apply the configuration
-        controller.configuration.parameters.set_configuration(configured_parameters)
-        print("✅ Successfully applied all filter coefficients")
+        # Apply the configuration, unless the caller is batching it with other changes
+        if push_configuration:
+            controller.configuration.parameters.set_configuration(configured_parameters)
+            logger.info("✅ Successfully applied all filter coefficients")
+        else:
+            logger.info("✅ Filter coefficients added to the pending configuration")
         return True
         
     except Exception as e:
-        print(f"❌ Error applying filter coefficients: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Error applying filter coefficients: %s", e)
         return False
 
-def apply_new_servo_params(axis, results, controller, ff_analysis_data=None, verification=False):
-    """Apply the shaped servo parameters from EasyTune results"""
-    print(f"Applying new servo parameters for axis {axis}")
+def apply_shaped_filters(axis, shaped_params, controller, configured_parameters=None, applied_filters=None):
+    """
+    Convert and write the shaped filters for one axis
     
-    # Extract all shaped parameters
-    shaped_params = extract_shaped_parameters(results)
+    Skips the coefficient calculation and the controller write entirely when there
+    are no filters or when they match the filters recorded in applied_filters for this
+    axis. When configured_parameters is given the coefficients are only written into
+    it, and the caller pushes it with set_configuration.
     
-    # Get configuration parameters
-    configured_parameters = controller.configuration.parameters.get_configuration()
+    Args:
+        applied_filters: Optional dictionary of the filters written to each axis, owned by
+                         the caller for one run (an MCD upload or reset between runs would
+                         make a longer-lived record stale). Updated when filters are written.
     
-    if verification:
-        # Apply filter coefficients if present
-        if 'Filters' in shaped_params:
-            print("\n🔧 Processing shaped filter configurations...")
-            # Assume 20kHz sample frequency - adjust as needed for your system
-            filter_coefficients = convert_filters_to_coefficients(shaped_params)
-            
-            if filter_coefficients:
-                apply_filter_coefficients_to_controller(axis, filter_coefficients, controller)
-
-    else:            
-        # Apply all gain parameters
-        if 'K' in shaped_params:
-            gain_k_original = controller.runtime.parameters.axes[axis].servo.servoloopgaink.value
-            print(f'Gain K Before: {gain_k_original}')
-            configured_parameters.axes[axis].servo.servoloopgaink.value = shaped_params['K']
-            print(f'Gain K Shaped: {shaped_params["K"]}')
-        
-        if 'Kip' in shaped_params:
-            kip_original = controller.runtime.parameters.axes[axis].servo.servoloopgainkip.value
-            print(f'Kip Before: {kip_original}')
-            configured_parameters.axes[axis].servo.servoloopgainkip.value = shaped_params['Kip']
-            print(f'Kip Shaped: {shaped_params["Kip"]}')
-        
-        if 'Kip2' in shaped_params:
-            kip2_original = controller.runtime.parameters.axes[axis].servo.servoloopgainkip2.value
-            print(f'Kip2 Before: {kip2_original}')
-            configured_parameters.axes[axis].servo.servoloopgainkip2.value = shaped_params['Kip2']
-            print(f'Kip2 Shaped: {shaped_params["Kip2"]}')
-        
-        if 'Kiv' in shaped_params:
-            kiv_original = controller.runtime.parameters.axes[axis].servo.servoloopgainkiv.value
-            print(f'Kiv Before: {kiv_original}')
-            configured_parameters.axes[axis].servo.servoloopgainkiv.value = shaped_params['Kiv']
-            print(f'Kiv Shaped: {shaped_params["Kiv"]}')
-        
-        if 'Kpv' in shaped_params:
-            kpv_original = controller.runtime.parameters.axes[axis].servo.servoloopgainkpv.value
-            print(f'Kpv Before: {kpv_original}')
-            configured_parameters.axes[axis].servo.servoloopgainkpv.value = shaped_params['Kpv']
-            print(f'Kpv Shaped: {shaped_params["Kpv"]}')
-        
-        if 'Kv' in shaped_params:
-            kv_original = controller.runtime.parameters.axes[axis].servo.servoloopgainkv.value
-            print(f'Kv Before: {kv_original}')
-            configured_parameters.axes[axis].servo.servoloopgainkv.value = shaped_params['Kv']
-            print(f'Kv Shaped: {shaped_params["Kv"]}')
-        
-        if 'Ksi1' in shaped_params:
-            ksi1_original = controller.runtime.parameters.axes[axis].servo.servoloopgainksi1.value
-            print(f'Ksi1 Before: {ksi1_original}')
-            configured_parameters.axes[axis].servo.servoloopgainksi1.value = shaped_params['Ksi1']
-            print(f'Ksi1 Shaped: {shaped_params["Ksi1"]}')
-        
-        if 'Ksi2' in shaped_params:
-            ksi2_original = controller.runtime.parameters.axes[axis].servo.servoloopgainksi2.value
-            print(f'Ksi2 Before: {ksi2_original}')
-            configured_parameters.axes[axis].servo.servoloopgainksi2.value = shaped_params['Ksi2']
-            print(f'Ksi2 Shaped: {shaped_params["Ksi2"]}')
-        
-        # Apply feedforward parameters
-        if 'Pff' in shaped_params:
-            pff_original = controller.runtime.parameters.axes[axis].servo.feedforwardgainpff.value
-            print(f'Pff Before: {pff_original}')
-            configured_parameters.axes[axis].servo.feedforwardgainpff.value = shaped_params['Pff']
-            print(f'Pff Shaped: {shaped_params["Pff"]}')
-        
-        if 'Vff' in shaped_params:
-            vff_original = controller.runtime.parameters.axes[axis].servo.feedforwardgainvff.value
-            print(f'Vff Before: {vff_original}')
-            configured_parameters.axes[axis].servo.feedforwardgainvff.value = shaped_params['Vff']
-            print(f'Vff Shaped: {shaped_params["Vff"]}')
-        
-        if 'Aff' in shaped_params:
-            aff_original = controller.runtime.parameters.axes[axis].servo.feedforwardgainaff.value
-            aff_shaped = shaped_params['Aff']
-            
-            if ff_analysis_data and 'center_magnitude_difference_db' in ff_analysis_data:
-                center_mag_diff = ff_analysis_data['center_magnitude_difference_db']
-                # Convert dB to absolute units and multiply by original Aff
-                center_mag_absolute = 10**(center_mag_diff/20)  # Convert from dB to absolute units
-                aff_adjusted = aff_original * center_mag_absolute
-                print(f'   Aff Adjusted: {aff_adjusted:.6f}')
-                configured_parameters.axes[axis].servo.feedforwardgainaff.value = aff_adjusted
-            else:
-                print(f'Aff Before: {aff_original}')
-                print(f'Aff Shaped: {aff_shaped} (no FF analysis data)')
-                configured_parameters.axes[axis].servo.feedforwardgainaff.value = aff_shaped
-        
-        if 'Jff' in shaped_params:
-            jff_original = controller.runtime.parameters.axes[axis].servo.feedforwardgainjff.value
-            print(f'Jff Before: {jff_original}')
-            configured_parameters.axes[axis].servo.feedforwardgainjff.value = shaped_params['Jff']
-            print(f'Jff Shaped: {shaped_params["Jff"]}')
-        
-        if 'Sff' in shaped_params:
-            sff_original = controller.runtime.parameters.axes[axis].servo.feedforwardgainsff.value
-            print(f'Sff Before: {sff_original}')
-            configured_parameters.axes[axis].servo.feedforwardgainsff.value = shaped_params['Sff']
-            print(f'Sff Shaped: {shaped_params["Sff"]}')
-        
-        if 'Feedforward_Advance__ms' in shaped_params:
-            ff_advance_original = controller.runtime.parameters.axes[axis].servo.feedforwardadvance.value
-            print(f'Feedforward Advance Before: {ff_advance_original}')
-            configured_parameters.axes[axis].servo.feedforwardadvance.value = shaped_params['Feedforward_Advance__ms']
-            print(f'Feedforward Advance Shaped: {shaped_params["Feedforward_Advance__ms"]}')
-        
-        # Note: Drive_Type, Is_Dual_loop, Drive_Frequency__hz, and Counts_Per_Unit 
-        # are typically system-level parameters that shouldn't be changed during tuning
-        
-        # Apply the configuration
-        try:
-            controller.configuration.parameters.set_configuration(configured_parameters)
-            print("✅ Successfully applied shaped servo parameters")
-            
-            # Print summary of applied parameters
-            applied_count = len([k for k in shaped_params.keys() if k not in ['Filters', 'Enhanced_Tracking', 'Drive_Type', 'Is_Dual_loop', 'Drive_Frequency__hz', 'Counts_Per_Unit']])
-            print("\n📋 PARAMETER UPDATE SUMMARY:")
-            print(f"   Axis: {axis}")
-            print(f"   Parameters Applied: {applied_count}")
-            
-            # Apply filter coefficients if present
-            if 'Filters' in shaped_params:
-                print("\n🔧 Processing shaped filter configurations...")
-                # Assume 20kHz sample frequency - adjust as needed for your system
-                filter_coefficients = convert_filters_to_coefficients(shaped_params)
-                
-                if filter_coefficients:
-                    apply_filter_coefficients_to_controller(axis, filter_coefficients, controller)
-            
-            return True
-        except Exception as e:
-            print(f"❌ Error applying parameters: {str(e)}")
-            return False
+    Returns:
+        bool: True if filters were written, False if skipped or the write failed
+    """
+    filters = shaped_params.get('Filters')
+    if not filters:
+        return False
+    
+    filters_key = (shaped_params.get('Drive_Frequency__hz'), freeze_filter_data(filters))
+    if applied_filters is not None and applied_filters.get(axis) == filters_key:
+        logger.info("\n🔧 Shaped filters unchanged since last apply - skipping")
+        return False
+    
+    logger.info("\n🔧 Processing shaped filter configurations...")
+    filter_coefficients = convert_filters_to_coefficients(shaped_params)
+    if not filter_coefficients:
+        return False
+    
+    applied = apply_filter_coefficients_to_controller(axis, filter_coefficients, controller, configured_parameters)
+    if applied and applied_filters is not None:
+        applied_filters[axis] = filters_key
+    return applied
+
+# Scale from dB to the natural log of the linear gain: 10**(dB/20) == exp(dB * DB_TO_LN_GAIN)
+DB_TO_LN_GAIN = math.log(10.0) / 20.0
+
+# EasyTune shaped parameter name -> (servo parameter attribute, report label), in report order
+SHAPED_TO_SERVO_ATTR = (
+    ('K', 'servoloopgaink', 'Gain K'),
+    ('Kip', 'servoloopgainkip', 'Kip'),
+    ('Kip2', 'servoloopgainkip2', 'Kip2'),
+    ('Kiv', 'servoloopgainkiv', 'Kiv'),
+    ('Kpv', 'servoloopgainkpv', 'Kpv'),
+    ('Kv', 'servoloopgainkv', 'Kv'),
+    ('Ksi1', 'servoloopgainksi1', 'Ksi1'),
+    ('Ksi2', 'servoloopgainksi2', 'Ksi2'),
+    ('Pff', 'feedforwardgainpff', 'Pff'),
+    ('Vff', 'feedforwardgainvff', 'Vff'),
+    ('Aff', 'feedforwardgainaff', 'Aff'),
+    ('Jff', 'feedforwardgainjff', 'Jff'),
+    ('Sff', 'feedforwardgainsff', 'Sff'),
+    ('Feedforward_Advance__ms', 'feedforwardadvance', 'Feedforward Advance'),
+)
+
+def apply_new_servo_params(axis, results, controller, ff_analysis_data=None, verification=False, applied_filters=None):
+    """Apply the shaped servo parameters from EasyTune results"""
+    return apply_new_servo_params_multi({axis: results}, controller, {axis: ff_analysis_data}, verification=verification,
+                                        applied_filters=applied_filters)
 
-def apply_servo_params_from_dict(servo_params, controller, available_axes):
+def apply_new_servo_params_multi(axis_results_map, controller, ff_map=None, verification=False, applied_filters=None):
     """
-    Apply all servo loop parameters from the servo_params dictionary to the controller.
-    axis_index (as string) is mapped to axis name using available_axes list.
+    Apply the shaped servo parameters from EasyTune results for several axes at once.
+    All axes are written into a single configuration snapshot which is pushed with one set_configuration call.
+
+    Args:
+        axis_results_map: Dictionary mapping axis name to EasyTune results
+        controller: Controller object
+        ff_map: Optional dictionary mapping axis name to FF analysis data
+        verification: If True, only the shaped filters are applied
+        applied_filters: Optional per-run record of applied filters, see apply_shaped_filters
     """
-    # Get the current configuration object
-    configured_parameters = controller.configuration.parameters.get_configuration()
+    if ff_map is None:
+        ff_map = {}
 
-    for axis_index_str, param_list in servo_params.items():
-        # axis_index_str is a string, convert to int for indexing
-        try:
-            axis_index = int(axis_index_str)
-        except Exception:
-            print(f"⚠️ Invalid axis index: {axis_index_str}")
-            continue
+    # Extract all shaped parameters
+    shaped_params_map = {}
+    for axis, results in axis_results_map.items():
+        logger.info("Applying new servo parameters for axis %s", axis)
+        shaped_params_map[axis] = extract_shaped_parameters(results)
+    
+    if verification:
+        for axis, shaped_params in shaped_params_map.items():
+            # Apply filter coefficients if present
+            apply_shaped_filters(axis, shaped_params, controller, applied_filters=applied_filters)
+        return None
 
-        # Map axis index to axis name using available_axes
-        if axis_index >= len(available_axes):
-            print(f"⚠️ Axis index {axis_index} out of range for available_axes")
-            continue
-        axis_name = available_axes[axis_index]
-        print(f"\n🔧 Applying servo parameters to axis '{axis_name}' (index {axis_index})")
+    # Get configuration parameters
+    configured_parameters = controller.configuration.parameters.get_configuration()
+    report = io.StringIO()
+    # The before/shaped report is DEBUG output, so skip its runtime reads when DEBUG is off
+    report_enabled = logger.isEnabledFor(logging.DEBUG)
+    changed = False
+
+    for axis, shaped_params in shaped_params_map.items():
+        ff_analysis_data = ff_map.get(axis)
+
+        # Aff is scaled from its current value when FF analysis data is available
+        scale_aff = bool(ff_analysis_data) and 'center_magnitude_difference_db' in ff_analysis_data
+
+        # Read the current values needed (report and Aff scaling) in one pass over the runtime servo parameters
+        runtime_servo = controller.runtime.parameters.axes[axis].servo
+        original_values = {attr: getattr(runtime_servo, attr).value for key, attr, _ in SHAPED_TO_SERVO_ATTR
+                           if key in shaped_params and (report_enabled or (key == 'Aff' and scale_aff))}
+
+        # Apply all gain and feedforward parameters
+        servo_cfg = configured_parameters.axes[axis].servo
+        for key, attr, label in SHAPED_TO_SERVO_ATTR:
+            if key not in shaped_params:
+                continue
+            if key == 'Aff':
+                aff_original = original_values.get(attr)
+                aff_shaped = shaped_params['Aff']
+                
+                if scale_aff:
+                    center_mag_diff = ff_analysis_data['center_magnitude_difference_db']
+                    # Convert dB to absolute units and multiply by original Aff
+                    center_mag_absolute = math.exp(center_mag_diff * DB_TO_LN_GAIN)  # Convert from dB to absolute units
+                    aff_adjusted = aff_original * center_mag_absolute
+                    if report_enabled:
+                        print(f'   Aff Adjusted: {aff_adjusted:.6f}', file=report)
+                    new_value = aff_adjusted
+                else:
+                    if report_enabled:
+                        print(f'Aff Before: {aff_original}', file=report)
+                        print(f'Aff Shaped: {aff_shaped} (no FF analysis data)', file=report)
+                    new_value = aff_shaped
+            else:
+                new_value = shaped_params[key]
+                if report_enabled:
+                    print(f'{label} Before: {original_values[attr]}', file=report)
+                    print(f'{label} Shaped: {new_value}', file=report)
 
-        for param in param_list:
-            param_name = param['name']
-            param_value = param['value']
+            # Only write values that differ, so an unchanged tune skips set_configuration
+            param_obj = getattr(servo_cfg, attr)
+            if param_obj.value != new_value:
+                param_obj.value = new_value
+                changed = True
 
-            # Try to set the parameter dynamically
-            try:
-                servo_obj = configured_parameters.axes[axis_name].servo
-                param_obj = getattr(servo_obj, param_name.lower())
-                param_obj.value = type(param_obj.value)(param_value)
-                print(f"    ✅ Set {param_name}.value = {param_value}")
-            except AttributeError as e:
-                print(f"    ⚠️ Parameter '{param_name}' not found on axis '{axis_name}': {e}")
-            except Exception as e:
-                print(f"    ⚠️ Error setting '{param_name}' on axis '{axis_name}': {e}")
+    # Log the whole before/shaped report in one go
+    if report_enabled:
+        logger.debug(report.getvalue().rstrip('\n'))
 
-    # Apply the configuration to the controller
+    # Write each axis's shaped filter coefficients into the same configuration, so gains and filters go out together
+    filter_axes = [axis for axis, shaped_params in shaped_params_map.items()
+                   if apply_shaped_filters(axis, shaped_params, controller, configured_parameters, applied_filters)]
+
+    # Note: Drive_Type, Is_Dual_loop, Drive_Frequency__hz, and Counts_Per_Unit 
+    # are typically system-level parameters that shouldn't be changed during tuning
+    
+    # Apply the configuration
     try:
-        controller.configuration.parameters.set_configuration(configured_parameters)
+        if changed or filter_axes:
+            controller.configuration.parameters.set_configuration(configured_parameters)
+            logger.info("✅ Successfully applied shaped servo parameters")
+        else:
+            logger.info("✅ Shaped servo parameters already match the controller configuration")
+        
+        for axis, shaped_params in shaped_params_map.items():
+            # Print summary of applied parameters
+            applied_count = len([k for k in shaped_params.keys() if k not in ['Filters', 'Enhanced_Tracking', 'Drive_Type', 'Is_Dual_loop', 'Drive_Frequency__hz', 'Counts_Per_Unit']])
+            logger.info("\n📋 PARAMETER UPDATE SUMMARY:")
+            logger.info("   Axis: %s", axis)
+            logger.info("   Parameters Applied: %s", applied_count)
+        
         return True
     except Exception as e:
-        print(f"❌ Error applying servo parameters: {e}")
+        # The filters never reached the controller, so they must not count as applied next time
+        if applied_filters is not None:
+            for axis in filter_axes:
+                applied_filters.pop(axis, None)
+        logger.error("❌ Error applying parameters: %s", e)
         return False
 
-def apply_feedforward_params_from_dict(feedforward_params, controller, available_axes):
+def _apply_params_from_dict(params_dict, controller, available_axes, label):
     """
-    Apply all feedforward parameters from the feedforward_params dictionary to the controller.
-    axis_index (as string) is mapped to axis name using available_axes list.
+    Apply every parameter in params_dict to the axes' servo configuration with one get/set_configuration pair.
+    axis_index (as string) is mapped to axis name using available_axes list; label ('servo' or 'feedforward') is used in the log.
     """
     # Get the current configuration object
     configured_parameters = controller.configuration.parameters.get_configuration()
+    axes_cfg = configured_parameters.axes
+    changed = False
 
-    for axis_index_str, param_list in feedforward_params.items():
+    for axis_index_str, param_list in params_dict.items():
         # axis_index_str is a string, convert to int for indexing
         try:
             axis_index = int(axis_index_str)
         except Exception:
-            print(f"⚠️ Invalid axis index: {axis_index_str}")
+            logger.warning("⚠️ Invalid axis index: %s", axis_index_str)
             continue
 
         # Map axis index to axis name using available_axes
         if axis_index >= len(available_axes):
-            print(f"⚠️ Axis index {axis_index} out of range for available_axes")
+            logger.warning("⚠️ Axis index %s out of range for available_axes", axis_index)
             continue
         axis_name = available_axes[axis_index]
-        print(f"\n🔧 Applying feedforward parameters to axis '{axis_name}' (index {axis_index})")
+        logger.info("\n🔧 Applying %s parameters to axis '%s' (index %s)", label, axis_name, axis_index)
 
+        servo_obj = None
         for param in param_list:
             param_name = param['name']
             param_value = param['value']
 
             # Try to set the parameter dynamically
             try:
-                servo_obj = configured_parameters.axes[axis_name].servo
+                if servo_obj is None:
+                    servo_obj = axes_cfg[axis_name].servo
                 param_obj = getattr(servo_obj, param_name.lower())
-                param_obj.value = type(param_obj.value)(param_value)
-                print(f"    ✅ Set {param_name}.value = {param_value}")
+                current_value = param_obj.value
+                new_value = type(current_value)(param_value)
+                if current_value == new_value:
+                    logger.debug("    ℹ️ %s.value already %s", param_name, param_value)
+                    continue
+                param_obj.value = new_value
+                changed = True
+                logger.debug("    ✅ Set %s.value = %s", param_name, param_value)
             except AttributeError as e:
-                print(f"    ⚠️ Parameter '{param_name}' not found on axis '{axis_name}': {e}")
+                logger.warning("    ⚠️ Parameter '%s' not found on axis '%s': %s", param_name, axis_name, e)
             except Exception as e:
-                print(f"    ⚠️ Error setting '{param_name}' on axis '{axis_name}': {e}")
+                logger.warning("    ⚠️ Error setting '%s' on axis '%s': %s", param_name, axis_name, e)
+
+    # Nothing differs from the current configuration - skip the set_configuration call
+    if not changed:
+        return True
 
     # Apply the configuration to the controller
     try:
         controller.configuration.parameters.set_configuration(configured_parameters)
         return True
     except Exception as e:
-        print(f"❌ Error applying feedforward parameters: {e}")
+        logger.error("❌ Error applying %s parameters: %s", label, e)
         return False
 
-def analyze_easy_tune(results):
-    """Analyze EasyTune results against stability standards"""
-    # Define standard target values and acceptable ranges
-    standards = {
-        'phase_margin': {
-            'target': 45,
-            'min': 38,
-            'max': 52,
-            'unit': 'degrees'
-        },
-        'gain_margin': {
-            'target': 10,
-            'min': 6,
-            'max': 15,
-            'unit': 'dB'
-        },
-        'sensitivity': {
-            'target': 6,
-            'max': 8,  # Should not exceed this value
-            'unit': 'dB'
-        }
-    }
+def apply_servo_params_from_dict(servo_params, controller, available_axes):
+    """
+    Apply all servo loop parameters from the servo_params dictionary to the controller.
+    axis_index (as string) is mapped to axis name using available_axes list.
+    """
+    return _apply_params_from_dict(servo_params, controller, available_axes, 'servo')
+
+def apply_feedforward_params_from_dict(feedforward_params, controller, available_axes):
+    """
+    Apply all feedforward parameters from the feedforward_params dictionary to the controller.
+    axis_index (as string) is mapped to axis name using available_axes list.
+    """
+    return _apply_params_from_dict(feedforward_params, controller, available_axes, 'feedforward')
+
+# Stability standards shared by analyze_easy_tune and check_stability_margins (read-only)
+STABILITY_STANDARDS = MappingProxyType({
+    'phase_margin': MappingProxyType({
+        'target': 45,
+        'min': 38,
+        'max': 52,
+        'unit': 'degrees'
+    }),
+    'gain_margin': MappingProxyType({
+        'target': 10,
+        'min': 6,
+        'max': 15,
+        'unit': 'dB'
+    }),
+    'sensitivity': MappingProxyType({
+        'target': 6,
+        'max': 8,  # Should not exceed this value
+        'unit': 'dB'
+    })
+})
+# (metric key, report heading, value extractor, display suffix) - one entry per checked metric
+STABILITY_METRIC_SPECS = (
+    ('phase_margin', '📐 PHASE MARGIN ANALYSIS:', lambda data: data['degrees'], '°'),
+    ('gain_margin', '📊 GAIN MARGIN ANALYSIS:', lambda data: abs(data['db']), ' dB'),
+    ('sensitivity', '🎯 SENSITIVITY ANALYSIS:', lambda data: data['db'], ' dB'),
+)
+STABILITY_METRIC_NAMES = tuple(spec[0] for spec in STABILITY_METRIC_SPECS)
+STABILITY_MIN = np.array([STABILITY_STANDARDS[name].get('min', -np.inf) for name in STABILITY_METRIC_NAMES], dtype=float)
+STABILITY_MAX = np.array([STABILITY_STANDARDS[name]['max'] for name in STABILITY_METRIC_NAMES], dtype=float)
+# Phase and gain margin are reported only; sensitivity is the only enforced limit
+STABILITY_ENFORCED = np.array([False, False, True])
+STABILITY_MIN.flags.writeable = False
+STABILITY_MAX.flags.writeable = False
+STABILITY_ENFORCED.flags.writeable = False
+
+def check_stability_margins(values):
+    """
+    Check stability metrics against STABILITY_STANDARDS in one vectorized pass
     
-    print("\n" + "="*60)
-    print("                STABILITY ANALYSIS REPORT")
-    print("="*60)
+    Args:
+        values: Array of shape (..., 3) ordered as STABILITY_METRIC_NAMES.
+                Use NaN for metrics that were not measured.
+        
+    Returns:
+        ndarray: Boolean pass mask with the same shape as values
+    """
+    values = np.asarray(values, dtype=float)
+    in_range = (values >= STABILITY_MIN) & (values <= STABILITY_MAX)
+    return in_range | np.isnan(values) | ~STABILITY_ENFORCED
+
+def analyze_easy_tune(results, log_file=None):
+    """Analyze EasyTune results against stability standards; the report goes to log_file when given, else the logger"""
+    standards = STABILITY_STANDARDS
+    
+    # Build the report in memory and write it out once
+    report = io.StringIO()
+    
+    print("\n" + "="*60, file=report)
+    print("                STABILITY ANALYSIS REPORT", file=report)
+    print("="*60, file=report)
     
     # Extract FF Analysis data
     ff_analysis_data = None
@@ -1123,117 +1282,161 @@ def analyze_easy_tune(results):
         ff_analysis_data = results['FF_Analysis']
         center_mag_diff = ff_analysis_data.get('center_magnitude_difference_db', 0.0)
         
-        print("\n🔧 FEEDFORWARD ANALYSIS:")
-        print(f"   Center Frequency: {ff_analysis_data.get('center_frequency_hz', 0):.1f} Hz")
-        print(f"   Center Magnitude Difference: {center_mag_diff:.3f} dB")
-        print(f"   Slope Difference: {ff_analysis_data.get('slope_difference_db_per_decade', 0):.3f} dB/decade")
+        print("\n🔧 FEEDFORWARD ANALYSIS:", file=report)
+        print(f"   Center Frequency: {ff_analysis_data.get('center_frequency_hz', 0):.1f} Hz", file=report)
+        print(f"   Center Magnitude Difference: {center_mag_diff:.3f} dB", file=report)
+        print(f"   Slope Difference: {ff_analysis_data.get('slope_difference_db_per_decade', 0):.3f} dB/decade", file=report)
     
     # Check if stability metrics exist in results
     if 'Stability_Metrics' not in results or 'original' not in results['Stability_Metrics']:
-        print("❌ ERROR: No stability metrics found in results")
+        print("❌ ERROR: No stability metrics found in results", file=report)
+        if log_file is not None:
+            log_file.write(report.getvalue())
+        else:
+            logger.error(report.getvalue().rstrip('\n'))
         return False
     
     #print(f"Results from analyze_easy_tune: {results}")
     stability_data = results['Stability_Metrics']['original']
     #shaped_data = results['Stability_Metrics']['shaped']
-    analysis_passed = True
-    issues = []
-
-    # Analyze Phase Margin
-    if 'phase_margin' in stability_data:
-        phase_margin = stability_data['phase_margin']['degrees']
-        crossover_freq = stability_data['phase_margin']['frequency_hz']
-        
-        print("\n📐 CROSSOVER FREQUENCY ANALYSIS:")
-        print(f"   Current Value: {crossover_freq:.1f} Hz")
-        
-        print("\n📐 PHASE MARGIN ANALYSIS:")
-        print(f"   Current Value: {phase_margin:.1f}° @ {crossover_freq:.1f} Hz")
-        print(f"   Target Range:  {standards['phase_margin']['min']}-{standards['phase_margin']['max']}°")
-        print(f"   Target Value:  {standards['phase_margin']['target']}°")
-
-        #if standards['phase_margin']['min'] <= phase_margin <= standards['phase_margin']['max']:
-            #print("   ✅ PASS - Phase margin within acceptable range")
-        #else:
-            #analysis_passed = False
-            #if phase_margin < standards['phase_margin']['min']:
-                #issues.append(f"Phase margin too low ({phase_margin:.1f}° < {standards['phase_margin']['min']}°)")
-                #print(f"   ❌ FAIL - Phase margin too low (minimum: {standards['phase_margin']['min']}°)")
-            #else:
-                #issues.append(f"Phase margin too high ({phase_margin:.1f}° > {standards['phase_margin']['max']}°)")
-                #print(f"   ⚠️  WARNING - Phase margin is high (maximum: {standards['phase_margin']['max']}°)")
-    
-    # Analyze Gain Margin
-    if 'gain_margin' in stability_data:
-        gain_margin = abs(stability_data['gain_margin']['db'])
-        gain_freq = stability_data['gain_margin']['frequency_hz']
-        
-        print("\n📊 GAIN MARGIN ANALYSIS:")
-        print(f"   Current Value: {gain_margin:.1f} dB @ {gain_freq:.1f} Hz")
-        print(f"   Target Range:  {standards['gain_margin']['min']}-{standards['gain_margin']['max']} dB")
-        print(f"   Target Value:  {standards['gain_margin']['target']} dB")
-        
-        #if standards['gain_margin']['min'] <= gain_margin <= standards['gain_margin']['max']:
-            #print("   ✅ PASS - Gain margin within acceptable range")
-        #else:
-            #analysis_passed = False
-            #if gain_margin < standards['gain_margin']['min']:
-                #issues.append(f"Gain margin too low ({gain_margin:.1f} dB < {standards['gain_margin']['min']} dB)")
-                #print(f"   ⚠️ FAIL - Gain margin low (minimum: {standards['gain_margin']['min']} dB)")
-            #else:
-                #issues.append(f"Gain margin too high ({gain_margin:.1f} dB > {standards['gain_margin']['max']} dB)")
-                #print(f"   ⚠️  WARNING - Gain margin high (maximum: {standards['gain_margin']['max']} dB)")
-    
-    # Analyze Sensitivity
-    if 'sensitivity' in stability_data:
-        sensitivity = stability_data['sensitivity']['db']
-        sensitivity_freq = stability_data['sensitivity']['frequency_hz']
-        
-        print("\n🎯 SENSITIVITY ANALYSIS:")
-        print(f"   Current Value: {sensitivity:.1f} dB @ {sensitivity_freq:.1f} Hz")
-        print(f"   Maximum Limit: {standards['sensitivity']['max']} dB")
-        print(f"   Target Value:  {standards['sensitivity']['target']} dB")
-        
-        if sensitivity <= standards['sensitivity']['max']:
-            print("   ✅ PASS - Sensitivity within acceptable limit")
+    
+    # Pack the measured metrics (NaN when missing) and evaluate them together
+    values = np.array([extract(stability_data[key]) if key in stability_data else np.nan
+                       for key, _, extract, _ in STABILITY_METRIC_SPECS])
+    passed = check_stability_margins(values)
+    analysis_passed = bool(passed.all())
+    
+    def describe_issue(index):
+        key = STABILITY_METRIC_NAMES[index]
+        unit = standards[key]['unit']
+        label = key.replace('_', ' ').capitalize()
+        if values[index] < STABILITY_MIN[index]:
+            return f"{label} too low ({values[index]:.1f} {unit} < {STABILITY_MIN[index]:g} {unit})"
+        return f"{label} exceeds limit ({values[index]:.1f} {unit} > {STABILITY_MAX[index]:g} {unit})"
+    
+    issues = [describe_issue(index) for index in np.where(~passed)[0]]
+
+    # Report each measured metric from the same table
+    for index, (key, heading, _, suffix) in enumerate(STABILITY_METRIC_SPECS):
+        if key not in stability_data:
+            continue
+        limits = standards[key]
+        frequency = stability_data[key]['frequency_hz']
+        
+        if key == 'phase_margin':
+            print("\n📐 CROSSOVER FREQUENCY ANALYSIS:", file=report)
+            print(f"   Current Value: {frequency:.1f} Hz", file=report)
+        
+        print(f"\n{heading}", file=report)
+        print(f"   Current Value: {values[index]:.1f}{suffix} @ {frequency:.1f} Hz", file=report)
+        if 'min' in limits:
+            print(f"   Target Range:  {limits['min']}-{limits['max']}{suffix}", file=report)
         else:
-            analysis_passed = False
-            issues.append(f"Sensitivity exceeds limit ({sensitivity:.1f} dB > {standards['sensitivity']['max']} dB)")
-            print("   ❌ FAIL - Sensitivity exceeds maximum limit")
+            print(f"   Maximum Limit: {limits['max']}{suffix}", file=report)
+        print(f"   Target Value:  {limits['target']}{suffix}", file=report)
+        
+        if STABILITY_ENFORCED[index]:
+            label = key.replace('_', ' ').capitalize()
+            if passed[index]:
+                print(f"   ✅ PASS - {label} within acceptable limit", file=report)
+            else:
+                print(f"   ❌ FAIL - {label} exceeds maximum limit", file=report)
     
     # Overall Assessment
-    print(f"\n{'='*60}")
+    print(f"\n{'='*60}", file=report)
     if analysis_passed:
-        print("🎉 OVERALL ASSESSMENT: PASS")
-        print("   All stability metrics meet the required standards.")
+        print("🎉 OVERALL ASSESSMENT: PASS", file=report)
+        print("   All stability metrics meet the required standards.", file=report)
     else:
-        print("⚠️  OVERALL ASSESSMENT: FAIL")
-        print("   The following issues were identified:")
+        print("⚠️  OVERALL ASSESSMENT: FAIL", file=report)
+        print("   The following issues were identified:", file=report)
         for i, issue in enumerate(issues, 1):
-            print(f"   {i}. {issue}")
+            print(f"   {i}. {issue}", file=report)
     
-    print("="*60)
+    print("="*60, file=report)
+    if log_file is not None:
+        log_file.write(report.getvalue())
+    else:
+        logger.info(report.getvalue().rstrip('\n'))
     
     return analysis_passed, ff_analysis_data
 
-def frequency_response(axis, controller, current_percent, verification=False, position=None, axes=None):
+def snapshot_axis_parameters(controller, axes):
+    """
+    Read the per-axis parameters used by the frequency response and validation moves in one pass
+    
+    Args:
+        controller: Connected Automation1 controller
+        axes: Axis names to snapshot
+        
+    Returns:
+        dict: Plain Python values per axis (units, motor_pole_pitch, motor_type, max_jog_speed,
+              soft_limit_high, soft_limit_low, reverse_motion)
+    """
+    params = controller.configuration.parameters.get_configuration()
+    snapshot = {}
+    for axis in axes:
+        config_axis = params.axes[axis]
+        runtime_axis = controller.runtime.parameters.axes[axis]
+        # Walk to the protection group once for both soft limits
+        protection = runtime_axis.protection
+        snapshot[axis] = {
+            'units': runtime_axis.units.unitsname.value,
+            'motor_pole_pitch': config_axis.motor.motorpolepitch.value,
+            'motor_type': config_axis.motor.motortype.value,
+            'max_jog_speed': config_axis.motion.maxjogspeed.value,
+            'soft_limit_high': protection.softwarelimithigh.value,
+            'soft_limit_low': protection.softwarelimitlow.value,
+            'reverse_motion': runtime_axis.motion.reversemotiondirection.value == 1,
+        }
+    return snapshot
+
+# Longest wait for a new .fr file to appear and finish writing, and how often to check it
+FR_FILE_TIMEOUT_S = 15
+FR_FILE_POLL_S = 0.5
+
+def wait_for_stable_file(file_path, timeout=FR_FILE_TIMEOUT_S, poll_interval=FR_FILE_POLL_S):
+    """
+    Wait until file_path exists and its size is unchanged between two polls
+    
+    Returns:
+        bool: True once two polls in a row see the same non-zero size, False if that does not
+              happen before the timeout (the file never appeared or was still being written)
+    """
+    deadline = time.monotonic() + timeout
+    last_size = -1
+    while True:
+        if os.path.exists(file_path):
+            size = os.path.getsize(file_path)
+            if size > 0 and size == last_size:
+                return True
+            last_size = size
+        if time.monotonic() >= deadline:
+            if last_size >= 0:
+                print(f"⚠️ {os.path.basename(file_path)} was still being written after {timeout} s")
+            return False
+        time.sleep(poll_interval)
+
+def frequency_response(axis, controller, current_percent, verification=False, position=None, axes=None, axis_params=None):
     """Generate frequency response file and return its path
     
     Args:
         axis: Axis name
         verification: If True, this is a verification run after parameter changes
         current_percent: Current percentage for verification run (default 50%)
+        axis_params: This axis' entry from snapshot_axis_parameters; read from the controller when omitted
     """
     global so_dir
 
-    params = controller.configuration.parameters.get_configuration()
-    units = params.axes[axis].units.unitsname.value
-    motor_pole_pitch = params.axes[axis].motor.motorpolepitch.value
-    motor = params.axes[axis].motor.motortype.value
+    if axis_params is None:
+        axis_params = snapshot_axis_parameters(controller, [axis])[axis]
+    units = axis_params['units']
+    motor_pole_pitch = axis_params['motor_pole_pitch']
+    motor = axis_params['motor_type']
     distance = calculate_unit_distance(motor_pole_pitch, units)
     
-    pos_limit = controller.runtime.parameters.axes[axis].protection.softwarelimithigh.value
-    neg_limit = controller.runtime.parameters.axes[axis].protection.softwarelimitlow.value
+    pos_limit = axis_params['soft_limit_high']
+    neg_limit = axis_params['soft_limit_low']
     travel = pos_limit + abs(neg_limit)
     
     if travel == 0 and motor == 1:
@@ -1262,90 +1465,108 @@ def frequency_response(axis, controller, current_percent, verification=False, po
     #fr_string = fr'AppFrequencyResponseTriggerMultisinePlus({axis}, "{fr_filename}", 10, 2500, 280, {current_percent}, TuningMeasurementType.ServoOpenLoop, 0, 0)'
     
     controller.runtime.commands.execute(fr_string,2)
-    axis_faults = check_for_faults(controller, axes if axes else [axis])
-
-    if axis_faults:
-        fault_init = decode_faults(axis_faults, axes, controller, fault_log = None)
-        decoded_faults = fault_init.get_fault()
+    decoded_faults = poll_faults(controller, axes if axes else [axis])
     if decoded_faults == 'OverCurrentFault':
         fr_string = fr'AppFrequencyResponseTriggerMultisinePlus({axis}, "{fr_filename}", 10, 2500, 280, 4, TuningMeasurementType.ServoOpenLoop, {distance}, {speed})'
         controller.runtime.commands.execute(fr_string,2)
         
-    time.sleep(10)
-    
-    # Move file from default location to SO directory
-    username = os.getlogin()
-    source_path = os.path.join(f"C:\\Users\\{username}\\Documents\\Automation1", fr_filename)
+    # Move file from default location to SO directory once the controller has finished writing it
+    source_path = os.path.join(AUTOMATION1_DIR, fr_filename)
     fr_filepath = os.path.join(so_dir, fr_filename)
     
-    if os.path.exists(source_path):
+    if wait_for_stable_file(source_path):
         os.replace(source_path, fr_filepath)
     else:
-        print(f"❌ Could not find {fr_filename} in default location")
+        print(f"❌ Could not find a complete {fr_filename} in default location")
         
     return fr_filepath, verification
 
-def optimize(fr_filepath=None, verification=False, position=None, performance_target=None):
-    """Run EasyTune optimization on FR file"""
+# Upper bound on a single EasyTune optimization before optimize() gives up waiting
+EASY_TUNE_TIMEOUT_S = 600
+
+def optimize(fr_filepath=None, verification=False, position=None, performance_target=None, log_file=None):
+    """Run EasyTune optimization on FR file, writing progress to log_file (default: sys.stdout)"""
     if not fr_filepath:
         raise ValueError("No .fr file path provided")
     
     axis = extract_axis_from_fr_filepath(fr_filepath)
 
-    easy_tune_module = Easy_Tune_Module(gui=None, block_layout_module=None)
+    easy_tune_module = Easy_Tune_Module(gui=None, block_layout_module=None, log_file=log_file)
     easy_tune_module.run_easy_tune(fr_filepath, verification, performance_target)
     
     # Wait for optimization to complete
-    while easy_tune_module.active_thread:
-        time.sleep(0.1)
+    if not easy_tune_module.wait_for_completion(timeout=EASY_TUNE_TIMEOUT_S):
+        print(f"❌ EasyTune optimization timed out after {EASY_TUNE_TIMEOUT_S} s", file=log_file)
+        return None, False, None, 0
     
     # Get the analysis results
     results, original_frd = easy_tune_module.get_results()
 
     if results is None:
-        print("❌ EasyTune optimization failed - no results available")
+        print("❌ EasyTune optimization failed - no results available", file=log_file)
         return None, False, None, 0
     
     if original_frd is None:
-        print("⚠️ Warning: No original FRD data available - continuing without plots")
+        print("⚠️ Warning: No original FRD data available - continuing without plots", file=log_file)
         
     shaped_data = results['Stability_Metrics']['original']
     if 'sensitivity' in shaped_data:
         sensitivity = shaped_data['sensitivity']['db']
-        print(f"Sensitivity: {sensitivity}")
+        print(f"Sensitivity: {sensitivity}", file=log_file)
         sensitivity_freq = shaped_data['sensitivity']['frequency_hz']
     
     # Analyze the results against standards
     if results:
-        stability_passed, ff_analysis_data = analyze_easy_tune(results)
-        print(f"\nStability Analysis: {'PASSED' if stability_passed else 'FAILED'}")
-        generate_plots_from_results(log_files=None, original_frd=original_frd, position=position, axis=axis)
+        stability_passed, ff_analysis_data = analyze_easy_tune(results, log_file=log_file)
+        print(f"\nStability Analysis: {'PASSED' if stability_passed else 'FAILED'}", file=log_file)
+        generate_plots_from_results(log_files=None, original_frd=original_frd, position=position, axis=axis, log_file=log_file)
     else:
-        print("No results available for analysis")
+        print("No results available for analysis", file=log_file)
         ff_analysis_data = None
     
     return results, stability_passed, ff_analysis_data, sensitivity
 
-def single_axis_frequency_response(axis, controller, current_percent, all_axes=None):
-    """Run frequency response tests at center and 4 corners of XY workspace"""
+# Corner test positions: (name, limit side per axis (0 = low, 1 = high), move directions)
+CORNER_TEST_POSITIONS = (
+    ('NE Corner', (1, 1), (-1, -1)),
+    ('NW Corner', (0, 1), (1, -1)),
+    ('SE Corner', (1, 0), (-1, 1)),
+    ('SW Corner', (0, 0), (1, 1)),
+)
+CORNER_SIDES = np.array([sides for _, sides, _ in CORNER_TEST_POSITIONS])
+
+def calculate_inset_limits(axis_limits, axis_distances, axes):
+    """
+    Travel limits pulled in by the coordinate offset plus FR distance, for all axes at once
+    
+    Returns:
+        ndarray: Shape (2, len(axes)); row 0 is the inset low limit, row 1 the inset high limit
+    """
+    limits = np.array([axis_limits[axis] for axis in axes], dtype=float)
+    margin = np.array([calculate_coordinate_offset(axis_limits, axis) + axis_distances[axis] for axis in axes])
+    return np.stack([limits[:, 0] + margin, limits[:, 1] - margin])
+
+def single_axis_frequency_response(axis, controller, current_percent, all_axes=None, fr_callback=None):
+    """Run frequency response tests at center and 4 corners of XY workspace
+    
+    Args:
+        fr_callback: Optional callable invoked with each FR file path as soon as it is acquired
+    """
     print(f"🔧 Starting frequency response testing for {axis}")
     
     rotary = False
     axis = axis[0]
     fr_files = [] 
-    params = controller.configuration.parameters.get_configuration()
+    params_snapshot = snapshot_axis_parameters(controller, [axis])
+    axis_params = params_snapshot[axis]
     # Get travel limits for both axes
     axis_limits = {}
     axis_distances = {}
-    rev_motion = controller.runtime.parameters.axes[axis].motion.reversemotiondirection.value
-    if rev_motion == 1:
-        reverse_motion = True
-    else:
-        reverse_motion = False
+    reverse_motion = axis_params['reverse_motion']
         
-    pos_limit = controller.runtime.parameters.axes[axis].protection.softwarelimithigh.value
-    neg_limit = controller.runtime.parameters.axes[axis].protection.softwarelimitlow.value
-    units = controller.runtime.parameters.axes[axis].units.unitsname.value
+    pos_limit = axis_params['soft_limit_high']
+    neg_limit = axis_params['soft_limit_low']
+    units = axis_params['units']
     
     if units == 'deg':
         rotary = True
@@ -1353,13 +1574,12 @@ def single_axis_frequency_response(axis, controller, current_percent, all_axes=N
     axis_limits[axis] = (neg_limit, pos_limit)
     
     travel = abs(axis_limits[axis][1] - axis_limits[axis][0])
-    speed = params.axes[axis].motion.maxjogspeed.value
-    motor_pole_pitch = params.axes[axis].motor.motorpolepitch.value
+    speed = axis_params['max_jog_speed']
+    motor_pole_pitch = axis_params['motor_pole_pitch']
     distance = calculate_unit_distance(motor_pole_pitch, units)
 
     limit = 'software off'
-    electrical_limit_value = get_limit_dec(controller, axis, limit)
-    controller.runtime.parameters.axes[axis].protection.faultmask.value = electrical_limit_value
+    set_fault_mask_limits(controller, [axis], limit)
 
     if distance >= travel:
         distance = travel/2.25
@@ -1375,41 +1595,34 @@ def single_axis_frequency_response(axis, controller, current_percent, all_axes=N
         else:   
             center = (axis_limits[axis][0] + axis_limits[axis][1]) / 2
 
-    # Define test positions (center + 4 corners)
+    # Define test positions (center + both ends of travel)
+    inset = calculate_inset_limits(axis_limits, axis_distances, [axis])[:, 0].tolist()
     test_positions = [
         {'name': 'Center', 
          'coords': (center),
          'directions': (1, 1)},  # Center uses default positive motion
-        {'name': 'NE Corner', 
-         'coords': ((axis_limits[axis][1] - calculate_coordinate_offset(axis_limits, axis)) - axis_distances[axis]),
-         'directions': (-1)}, 
-        {'name': 'NW Corner', 
-         'coords': ((axis_limits[axis][0] + calculate_coordinate_offset(axis_limits, axis)) + axis_distances[axis]),
-         'directions': (1)}  
-        
     ]
+    for name, sides, directions in CORNER_TEST_POSITIONS[:2]:
+        test_positions.append({'name': name, 'coords': inset[sides[0]], 'directions': directions[0]})
     
     # Home axes first
     print("\n🏠 Homing axes...")
     controller.runtime.commands.motion.enable(all_axes)
     
     # Check for faults after enable
-    axis_faults = check_for_faults(controller, all_axes)
-    if axis_faults:
-        fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-        decoded_faults = fault_init.get_fault()
+    decoded_faults = poll_faults(controller, all_axes)
+    if decoded_faults:
         print(f"❌ Faults detected after enable: {decoded_faults}")
     
     controller.runtime.commands.motion.home(axis)
     
     # Check for faults after homing
-    axis_faults = check_for_faults(controller, all_axes if all_axes else [axis])
-    if axis_faults:
-        fault_init = decode_faults(axis_faults, all_axes if all_axes else [axis], controller, fault_log = None)
-        decoded_faults = fault_init.get_fault()
+    decoded_faults = poll_faults(controller, all_axes if all_axes else [axis])
+    if decoded_faults:
         print(f"❌ Faults detected after homing: {decoded_faults}")
     
-    time.sleep(2)
+    # Settle on the controller's in-position check (InPositionDistance/InPositionTime) instead of a fixed sleep
+    controller.runtime.commands.motion.waitforinposition([axis])
 
     for position in test_positions:
         x = position['coords']
@@ -1417,16 +1630,12 @@ def single_axis_frequency_response(axis, controller, current_percent, all_axes=N
         
         # Move to position
         controller.runtime.commands.motion.moveabsolute([axis], [x], [speed])
-        controller.runtime.commands.motion.waitformotiondone([axis])
-        time.sleep(1)  # Allow time for movement
+        controller.runtime.commands.motion.waitforinposition([axis])
         
         # Check for faults after move
         
-        axis_faults = check_for_faults(controller, all_axes if all_axes else [axis])
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes if all_axes else [axis], controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()    
-        
+        decoded_faults = poll_faults(controller, all_axes if all_axes else [axis])
+        if decoded_faults:
             print(f"❌ Faults detected at {position['name']}: {decoded_faults}")
    
         # Run FR for each axis
@@ -1439,10 +1648,13 @@ def single_axis_frequency_response(axis, controller, current_percent, all_axes=N
             verification=True,
             current_percent=current_percent,
             position=position,
-            axes=all_axes
+            axes=all_axes,
+            axis_params=axis_params
         )
 
         fr_files.append(fr_filepath)
+        if fr_callback:
+            fr_callback(fr_filepath)
 
         print("✅ Initial Frequency Responses Completed")
 
@@ -1450,17 +1662,20 @@ def single_axis_frequency_response(axis, controller, current_percent, all_axes=N
             break
 
     limit = 'software off'
-    electrical_limit_value = get_limit_dec(controller, axis, limit)
-    controller.runtime.parameters.axes[axis].protection.faultmask.value = electrical_limit_value
+    set_fault_mask_limits(controller, [axis], limit)
 
     return fr_files
 
-def multi_axis_frequency_response(axes, controller, current_percent, all_axes=None):
-    """Run frequency response tests at center and 4 corners of XY workspace"""
+def multi_axis_frequency_response(axes, controller, current_percent, all_axes=None, fr_callback=None):
+    """Run frequency response tests at center and 4 corners of XY workspace
+    
+    Args:
+        fr_callback: Optional callable invoked with each FR file path as soon as it is acquired
+    """
     print(f"🔧 Starting multi-axis testing for axes {axes}")
     
     rotary = False
-    params = controller.configuration.parameters.get_configuration()
+    params_snapshot = snapshot_axis_parameters(controller, axes)
     fr_files = []
     units = []
     # Get travel limits for both axes
@@ -1470,20 +1685,17 @@ def multi_axis_frequency_response(axes, controller, current_percent, all_axes=No
     
     reverse_motion = {}
     for axis in axes:
-        rev_motion = controller.runtime.parameters.axes[axis].motion.reversemotiondirection.value
-        if rev_motion == 1:
-            reverse_motion[axis] = True
-        else:
-            reverse_motion[axis] = False
+        axis_params = params_snapshot[axis]
+        reverse_motion[axis] = axis_params['reverse_motion']
             
-        pos_limit = controller.runtime.parameters.axes[axis].protection.softwarelimithigh.value
-        neg_limit = controller.runtime.parameters.axes[axis].protection.softwarelimitlow.value
-        units_value = controller.runtime.parameters.axes[axis].units.unitsname.value
-        speed = params.axes[axis].motion.maxjogspeed.value
+        pos_limit = axis_params['soft_limit_high']
+        neg_limit = axis_params['soft_limit_low']
+        units_value = axis_params['units']
+        speed = axis_params['max_jog_speed']
         units.append(units_value)
         axis_limits[axis] = (neg_limit, pos_limit)
 
-        motor_pole_pitch = params.axes[axis].motor.motorpolepitch.value
+        motor_pole_pitch = axis_params['motor_pole_pitch']
         distance = calculate_unit_distance(motor_pole_pitch, units_value)
         travel = abs(axis_limits[axis][1] - axis_limits[axis][0])
         
@@ -1491,9 +1703,8 @@ def multi_axis_frequency_response(axes, controller, current_percent, all_axes=No
             distance = travel/2.25
             
         axis_distances[axis] = distance
-    
-        electrical_limit_value = get_limit_dec(controller, axis, limit)
-        controller.runtime.parameters.axes[axis].protection.faultmask.value = electrical_limit_value
+
+    set_fault_mask_limits(controller, axes, limit)
 
     if units[0] == 'deg' and units[1] == 'deg':
         rotary = True
@@ -1512,23 +1723,15 @@ def multi_axis_frequency_response(axes, controller, current_percent, all_axes=No
 
         
     # Define test positions with calculated centers
+    inset = calculate_inset_limits(axis_limits, axis_distances, [x_axis, y_axis])
+    corners = inset[CORNER_SIDES, np.arange(2)].tolist()
     test_positions = [
         {'name': 'Center', 
          'coords': (x_center, y_center),
          'directions': (1, 1)},
-        {'name': 'NE Corner', 
-         'coords': ((axis_limits[x_axis][1] - calculate_coordinate_offset(axis_limits, x_axis)) - axis_distances[x_axis], (axis_limits[y_axis][1] - calculate_coordinate_offset(axis_limits, y_axis)) - axis_distances[y_axis]),
-         'directions': (-1, -1)},
-        {'name': 'NW Corner', 
-         'coords': ((axis_limits[x_axis][0] + calculate_coordinate_offset(axis_limits, x_axis)) + axis_distances[x_axis], (axis_limits[y_axis][1] - calculate_coordinate_offset(axis_limits, y_axis)) - axis_distances[y_axis]),
-         'directions': (1, -1)},
-        {'name': 'SE Corner', 
-         'coords': ((axis_limits[x_axis][1] - calculate_coordinate_offset(axis_limits, x_axis)) - axis_distances[x_axis], (axis_limits[y_axis][0] + calculate_coordinate_offset(axis_limits, y_axis)) + axis_distances[y_axis]),
-         'directions': (-1, 1)},
-        {'name': 'SW Corner', 
-         'coords': ((axis_limits[x_axis][0] + calculate_coordinate_offset(axis_limits, x_axis)) + axis_distances[x_axis], (axis_limits[y_axis][0] + calculate_coordinate_offset(axis_limits, y_axis)) + axis_distances[y_axis]),
-         'directions': (1, 1)}
     ]
+    for (name, _, directions), (x, y) in zip(CORNER_TEST_POSITIONS, corners):
+        test_positions.append({'name': name, 'coords': (x, y), 'directions': directions})
 
     # Home axes first
     print("\n🏠 Homing axes...")
@@ -1536,23 +1739,18 @@ def multi_axis_frequency_response(axes, controller, current_percent, all_axes=No
     controller.runtime.commands.motion.enable(all_axes)
     
     # Check for faults after enable
-    axis_faults = check_for_faults(controller, all_axes)
-    if axis_faults:
-        fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-        decoded_faults = fault_init.get_fault()
+    decoded_faults = poll_faults(controller, all_axes)
+    if decoded_faults:
         print(f"❌ Faults detected after enable: {decoded_faults}")
     
     controller.runtime.commands.motion.home(axes)
     
     # Check for faults after homing
-    axis_faults = check_for_faults(controller, all_axes if all_axes else axes)
-    if axis_faults:
-        fault_init = decode_faults(axis_faults, all_axes if all_axes else axes, controller, fault_log = None)
-        decoded_faults = fault_init.get_fault()
+    decoded_faults = poll_faults(controller, all_axes if all_axes else axes)
+    if decoded_faults:
         print(f"❌ Faults detected after homing: {decoded_faults}")
     
-    controller.runtime.commands.motion.waitformotiondone(axes)
-    time.sleep(2)
+    controller.runtime.commands.motion.waitforinposition(axes)
 
     for position in test_positions:
         x, y = position['coords']
@@ -1560,16 +1758,12 @@ def multi_axis_frequency_response(axes, controller, current_percent, all_axes=No
         
         # Move to position
         controller.runtime.commands.motion.moveabsolute(axes, [x, y], [speed, speed])
-        controller.runtime.commands.motion.waitformotiondone(axes)
-        time.sleep(1)  # Allow time for movement
+        controller.runtime.commands.motion.waitforinposition(axes)
         
         # Check for faults after move
         
-        axis_faults = check_for_faults(controller, axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()    
-        
+        decoded_faults = poll_faults(controller, axes)
+        if decoded_faults:
             print(f"❌ Faults detected at {position['name']}: {decoded_faults}")
 
         # Run FR for each axis
@@ -1583,38 +1777,40 @@ def multi_axis_frequency_response(axes, controller, current_percent, all_axes=No
                 verification=True,
                 current_percent=current_percent,
                 position=position,
-                axes=axes
+                axes=axes,
+                axis_params=params_snapshot[axis]
             )
 
             fr_files.append(fr_filepath)
+            if fr_callback:
+                fr_callback(fr_filepath)
             
             if rotary:
                 break
         print("✅ Initial Frequency Responses Completed")
 
     limit = 'software on'
-    for axis in axes:
-        electrical_limit_value = get_limit_dec(controller, axis, limit)
-        controller.runtime.parameters.axes[axis].protection.faultmask.value = electrical_limit_value
+    set_fault_mask_limits(controller, axes, limit)
 
     return fr_files
 
-def generate_plots_from_results(log_files=None, original_frd=None, position=None, axis=None):
+def generate_plots_from_results(log_files=None, original_frd=None, position=None, axis=None, log_file=None):
     """
     Generate interactive plots from all FR and log files in the output directory
     
     Args:
         output_dir: Directory containing FR and log files (default: current directory)
+        log_file: Stream for status messages (default: sys.stdout)
     """
     global so_dir
 
-    plotter = EasyTunePlotter(so_dir)
+    plotter = EasyTunePlotter(so_dir, log_file=log_file)
     if log_files:
         # Initialize plotter and create analysis
         plotter.create_combined_analysis(log_files)
     if original_frd:
         plotter.create_bode_plot(original_frd, position=position, axis=axis)
-    print("✅ Interactive plots generated successfully!")
+    print("✅ Interactive plots generated successfully!", file=log_file)
 
 # Recalculate time with proper motion profile
 def calculate_trapezoidal_time(distance, max_velocity, acceleration):
@@ -1626,76 +1822,253 @@ def calculate_trapezoidal_time(distance, max_velocity, acceleration):
         # Peak velocity = sqrt(accel * distance)
         peak_velocity = math.sqrt(acceleration * distance)
         time = 2 * peak_velocity / acceleration
-        print(f"📊 Triangular profile: Peak speed {peak_velocity:.1f}, Time {time:.1f}s")
+        logger.debug("📊 Triangular profile: Peak speed %.1f, Time %.1fs", peak_velocity, time)
     else:
         # Trapezoidal profile - reaches max speed
         accel_time = max_velocity / acceleration
         const_velocity_distance = distance - min_distance
         const_velocity_time = const_velocity_distance / max_velocity
         time = 2 * accel_time + const_velocity_time
-        print(f"📊 Trapezoidal profile: Accel {accel_time:.1f}s + Const {const_velocity_time:.1f}s + Decel {accel_time:.1f}s = {time:.1f}s")
+        logger.debug("📊 Trapezoidal profile: Accel %.1fs + Const %.1fs + Decel %.1fs = %.1fs", accel_time, const_velocity_time, accel_time, time)
     
     return time
 
-def move_profile(controller: a1.Controller, axes: list, velocity: float, n: int, filename: str, so_dir: str, position: list):
+# Task program completion polling: first and longest sleep between checks, and the growth factor
+PROGRAM_POLL_MIN_S = 0.01
+PROGRAM_POLL_MAX_S = 0.2
+PROGRAM_POLL_BACKOFF = 1.5
+
+def wait_for_program_complete(controller: a1.Controller, task_index=1):
+    """
+    Wait for the program on a controller task to complete
+    
+    The SDK has no blocking wait for task state, so poll with a short sleep that
+    backs off to PROGRAM_POLL_MAX_S. Short programs return within a few ms of finishing.
+    """
+    task = controller.runtime.tasks[task_index]
+    complete = a1.TaskState.ProgramComplete.value
+    poll_interval = PROGRAM_POLL_MIN_S
+    # status is queried from the controller on every access, so read it fresh each check
+    while task.status.task_state != complete:
+        time.sleep(poll_interval)
+        poll_interval = min(PROGRAM_POLL_MAX_S, poll_interval * PROGRAM_POLL_BACKOFF)
+
+@lru_cache(maxsize=None)
+def read_program_template(template_path):
+    """Read an AeroScript program template once; callers fill in a copy of the returned text"""
+    with open(template_path) as f:
+        return f.read()
+
+def move_profile(controller: a1.Controller, axes: list, velocity: float, n: int, filename: str, so_dir: str, position: list):
+    """
+    Move the stage to the specified coordinates and collect data
+    """
+    program_contents = read_program_template(r'assets\programs\Move.txt')
+        
+    # Populate the program variables
+    program_variables = f'''Program variables
+    var $axes[] as axis = [{",".join(axes)}]
+    var $speed[] as real = {velocity}
+    var $distance[] as real = {position}
+    var $numsamples as integer = {n}
+    var $sampletime as real = {1}
+    var $index as integer
+    var $filename as string = "{filename}"'''
+    
+    # Insert the variables into the program
+    program_contents = program_contents.replace('Program variables', program_variables)
+    
+    # Write the program to a controller AeroScript file
+    controller.files.write_text('Move.ascript', program_contents)
+    
+    # Execute the program
+    controller.runtime.tasks[1].program.run('Move.ascript')
+
+    # Wait for the program to finish
+    wait_for_program_complete(controller)
+        
+    # Copy the output data file to the local output folder
+    with open(os.path.join(so_dir, 'Performance Analysis', filename), 'wb') as f:
+        f.write(controller.files.read_bytes(filename))
+        
+    # Create a result object from the file
+    result = DatFile.create_from_file(os.path.join(so_dir, 'Performance Analysis', filename))
+
+    return result
+
+def move_profile_sequence(controller: a1.Controller, axes: list, velocity: float, n: int, filename: str, so_dir: str, positions: list):
     """
-    Move the stage to the specified coordinates and collect data
+    Run several moves in one controller program and one data collection session
+
+    Each move is followed by the same 2 s dwell used by move_profile, so a single
+    data file holds every leg. Use split_move_sequence to recover the individual moves.
+
+    Args:
+        n: Total number of samples to collect across all moves
+        positions: List of absolute target positions, one list per move
     """
-    with open(r'assets\programs\Move.txt') as f:
-                
-        program_contents = f.read()
-        
+    program_contents = read_program_template(r'assets\programs\MoveSequence.txt')
+
     # Populate the program variables
+    target_variables = ''.join(f'''
+    var $target{index}[] as real = {position}''' for index, position in enumerate(positions))
     program_variables = f'''Program variables
     var $axes[] as axis = [{",".join(axes)}]
     var $speed[] as real = {velocity}
-    var $distance[] as real = {position}
     var $numsamples as integer = {n}
     var $sampletime as real = {1}
     var $index as integer
-    var $filename as string = "{filename}"'''
-    
-    # Insert the variables into the program
+    var $filename as string = "{filename}"{target_variables}'''
+
+    # Unroll the moves so each leg runs back to back inside the same program
+    motion_sequence = 'Motion sequence' + ''.join(f'''
+    MoveAbsolute($axes, $target{index}, $speed)
+    WaitForMotionDone($axes)
+    Dwell(2)''' for index in range(len(positions)))
+
+    # Insert the variables and moves into the program
     program_contents = program_contents.replace('Program variables', program_variables)
-    
+    program_contents = program_contents.replace('Motion sequence', motion_sequence)
+
     # Write the program to a controller AeroScript file
-    controller.files.write_text('Move.ascript', program_contents)
-    
+    controller.files.write_text('MoveSequence.ascript', program_contents)
+
     # Execute the program
-    controller.runtime.tasks[1].program.run('Move.ascript')
+    controller.runtime.tasks[1].program.run('MoveSequence.ascript')
 
     # Wait for the program to finish
-    while controller.runtime.tasks[1].status.task_state != a1.TaskState.ProgramComplete.value:
-        time.sleep(0.2)
-        
+    wait_for_program_complete(controller)
+
     # Copy the output data file to the local output folder
     with open(os.path.join(so_dir, 'Performance Analysis', filename), 'wb') as f:
         f.write(controller.files.read_bytes(filename))
-        
+
     # Create a result object from the file
     result = DatFile.create_from_file(os.path.join(so_dir, 'Performance Analysis', filename))
 
     return result
 
+def split_move_sequence(data, axes: list, move_names: list):
+    """
+    Split a move_profile_sequence result into one result per move
+
+    Moves are located from the rising edges of the commanded velocity; each move
+    runs until the next one starts, so it keeps its own dwell.
+
+    Args:
+        data: DatFile result returned by move_profile_sequence
+        axes: Axis names that were moved
+        move_names: Name for each move in order
+
+    Returns:
+        dict: {move_name: object with an all_data dict of sliced signals}, or None if the
+              number of moves found does not match move_names (e.g. a zero-length move)
+    """
+    signal_cache = {}
+    vel_cmd = np.vstack([get_signal_array(data, f'VelCmd{axis}', signal_cache) for axis in axes])
+    moving = np.abs(vel_cmd).max(axis=0) > 1e-6
+    starts = np.flatnonzero(moving[1:] & ~moving[:-1]) + 1
+    if moving[0]:
+        starts = np.concatenate(([0], starts))
+
+    if len(starts) != len(move_names):
+        print(f"⚠️ Expected {len(move_names)} moves in sequence data, found {len(starts)}")
+        return None
+
+    ends = np.append(starts[1:], moving.shape[0])
+    results = {}
+    for move_name, start, end in zip(move_names, starts, ends):
+        all_data = {key: values[start:end] for key, values in data.all_data.items()}
+        results[move_name] = SimpleNamespace(all_data=all_data)
+    return results
+
+# Move names used in the stage performance .dat filenames on the controller: the combined
+# sequences first, then the per-move files written when a sequence falls back to move_profile
+STAGE_PERFORMANCE_DAT_MOVES = ('PosNeg', 'SW_NE_SW', 'SE_NW_SE', 'Positive', 'Negative', 'SW_NE', 'NE_SW', 'SE_NW', 'NW_SE')
+
+# Largest combined data collection run_stage_moves will request (90 s at 1 kHz). This is a conservative
+# bound, not a controller specification; past it the moves run one at a time with move_profile, which
+# collects n samples per move as the stage performance moves always have.
+STAGE_SEQUENCE_MAX_SAMPLES = 90_000
+
+def stage_performance_dat_filename(test_type, move_name):
+    """Controller .dat filename for a stage performance move, shared by the moves and cleanup_controller"""
+    return f"stage_performance_{test_type}_{move_name}.dat"
+
+def pos_neg_moves(test_type, pos_target, neg_target):
+    """The Positive then Negative move pair for run_stage_moves"""
+    return [
+        ('pos', pos_target, stage_performance_dat_filename(test_type, 'Positive')),
+        ('neg', neg_target, stage_performance_dat_filename(test_type, 'Negative')),
+    ]
+
+def run_stage_moves(controller: a1.Controller, axes: list, velocity: list, n: int, so_dir: str, start_position: list, moves: list, sequence_filename: str, all_axes=None):
+    """
+    Run consecutive stage performance moves from start_position in one program and one data collection
+
+    The collection holds n samples per move, up to STAGE_SEQUENCE_MAX_SAMPLES. Past that
+    limit, or if the combined data cannot be split back into its moves, each move runs on
+    its own with move_profile, with a fault check and a .dat file per move. Nothing is
+    repeated once an axis has faulted.
+
+    Args:
+        n: Number of samples to collect for one move
+        start_position: Position the stage is at before the first move
+        moves: List of (move_name, target position, .dat filename) in order
+        sequence_filename: .dat filename for the combined data collection
+
+    Returns:
+        dict: {move_name: result}
+    """
+    positions = [list(position) for _, position, _ in moves]
+    total_samples = n * len(moves)
+    if total_samples <= STAGE_SEQUENCE_MAX_SAMPLES:
+        sequence_results = move_profile_sequence(controller, axes, velocity, total_samples, sequence_filename, so_dir, positions)
+
+        decoded_faults = poll_faults(controller, all_axes)
+        if decoded_faults:
+            print(f"❌ Move sequence faulted ({decoded_faults}), not repeating the moves")
+            return {}
+
+        results = split_move_sequence(sequence_results, axes, [move_name for move_name, _, _ in moves])
+        if results is not None:
+            return results
+
+        print("⚠️ Could not split the move sequence, repeating each move on its own")
+        controller.runtime.commands.motion.moveabsolute(axes, list(start_position), velocity)
+        controller.runtime.commands.motion.waitforinposition(axes)
+    else:
+        print(f"ℹ️ {total_samples} samples exceeds the {STAGE_SEQUENCE_MAX_SAMPLES} sample sequence limit, running each move on its own")
+
+    results = {}
+    for (move_name, _, filename), position in zip(moves, positions):
+        results[move_name] = move_profile(controller, axes, velocity, n, filename, so_dir, position)
+        decoded_faults = poll_faults(controller, all_axes)
+        if decoded_faults:
+            print(f"❌ {move_name} move faulted ({decoded_faults}), skipping the remaining moves")
+            break
+    return results
+
 def validate_stage_performance(controller: a1.Controller, axes_dict: dict, test_type: str, axis_limits: dict, all_axes=None):
     """
     Validate stage performance by collecting data on the specified axes
     """
     rotary = False
     units = []
-    params = controller.configuration.parameters.get_configuration()
     
     results = {}
     if test_type == 'multi':
         axis_keys = list(axes_dict.keys())
         reverse_motion = {}
         for axis in axis_keys:
-            units_value = controller.runtime.parameters.axes[axis].units.unitsname.value
+            # Walk to the runtime axis parameters once for both reads
+            runtime_axis = controller.runtime.parameters.axes[axis]
+            units_value = runtime_axis.units.unitsname.value
             units.append(units_value)
             ramp_value = axes_dict[axis][1]  # Get the max_accel for this specific axis
             ramp_value_decel = ramp_value
             controller.runtime.commands.motion_setup.setupaxisrampvalue(axis, a1.RampMode.Rate, ramp_value, a1.RampMode.Rate, ramp_value_decel)
-            rev_motion = controller.runtime.parameters.axes[axis].motion.reversemotiondirection.value
+            rev_motion = runtime_axis.motion.reversemotiondirection.value
             if rev_motion == 1:
                 reverse_motion[axis] = True
             else:
@@ -1760,14 +2133,13 @@ def validate_stage_performance(controller: a1.Controller, axes_dict: dict, test_
         print("\n🏠 Homing axes...")
         controller.runtime.commands.motion.enable(all_axes)
         controller.runtime.commands.motion.home(axis_keys)
-        controller.runtime.commands.motion.waitformotiondone(axis_keys)
-        time.sleep(2)
+        controller.runtime.commands.motion.waitforinposition(axis_keys)
         
         # Extract coordinates for the movements
-        sw_coords = (axis_limits[axis_keys[0]][0] + calculate_coordinate_offset(axis_limits, axis_keys[0]), axis_limits[axis_keys[1]][0] + calculate_coordinate_offset(axis_limits, axis_keys[1]))
-        ne_coords = (axis_limits[axis_keys[0]][1] - calculate_coordinate_offset(axis_limits, axis_keys[0]), axis_limits[axis_keys[1]][1] - calculate_coordinate_offset(axis_limits, axis_keys[1]))
-        se_coords = (axis_limits[axis_keys[0]][1] - calculate_coordinate_offset(axis_limits, axis_keys[0]), axis_limits[axis_keys[1]][0] + calculate_coordinate_offset(axis_limits, axis_keys[1]))
-        nw_coords = (axis_limits[axis_keys[0]][0] + calculate_coordinate_offset(axis_limits, axis_keys[0]), axis_limits[axis_keys[1]][1] - calculate_coordinate_offset(axis_limits, axis_keys[1]))
+        # Corners are the travel limits pulled in by the coordinate offset only (no FR distance)
+        xy_axes = axis_keys[:2]
+        inset = calculate_inset_limits(axis_limits, dict.fromkeys(xy_axes, 0.0), xy_axes)
+        ne_coords, nw_coords, se_coords, sw_coords = map(tuple, inset[CORNER_SIDES, np.arange(2)].tolist())
         center_coords = (x_center, y_center)
         velocity = [axes_dict[axis][0] for axis in axis_keys[:2]]
 
@@ -1775,146 +2147,71 @@ def validate_stage_performance(controller: a1.Controller, axes_dict: dict, test_
             # Execute movement sequence
             print("\n🔄 Executing movement sequence...")
 
-            move_name = 'Positive'
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"stage_performance_{test_type}_{move_name}_{timestamp}.dat"
-
-            # Call Studio to run move profile and save readable .dat file
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, distance)
-            
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
-
-            results['pos'] = move_results
-
-            move_name = 'Negative'
-            filename = f"stage_performance_{test_type}_{move_name}.dat"
-
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, [0,0])
-
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
+            # Both legs run in one program and one data collection
+            filename = stage_performance_dat_filename(test_type, 'PosNeg')
 
-            results['neg'] = move_results
+            # Call Studio to run the move sequence and save readable .dat file
+            results.update(run_stage_moves(controller, axis_keys, velocity, n, so_dir, [0, 0],
+                                           pos_neg_moves(test_type, distance, [0, 0]), filename, all_axes))
 
         if rotary:
             # Movement 1: SW → NE → SW
             print("📍 Move 1: SW → NE → SW")
             controller.runtime.commands.motion.moveabsolute(axis_keys, list(sw_coords), velocity)
-            controller.runtime.commands.motion.waitformotiondone(axis_keys)
-            time.sleep(0.5)
+            controller.runtime.commands.motion.waitforinposition(axis_keys)
 
-            move_name = 'Positive'
-            filename = f"stage_performance_{test_type}_{move_name}.dat"
+            # Both legs run in one program and one data collection
+            filename = stage_performance_dat_filename(test_type, 'PosNeg')
 
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, list(ne_coords))
-
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
-
-            results['pos'] = move_results
-
-            move_name = 'Negative'
-            filename = f"stage_performance_{test_type}_{move_name}.dat"
-
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, list(sw_coords))
-
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
-
-            results['neg'] = move_results
+            results.update(run_stage_moves(controller, axis_keys, velocity, n, so_dir, sw_coords,
+                                           pos_neg_moves(test_type, ne_coords, sw_coords), filename, all_axes))
 
         # Movement 1: SW → NE → SW
         print("📍 Move 1: SW → NE → SW")
         controller.runtime.commands.motion.moveabsolute(axis_keys, list(sw_coords), velocity)
-        controller.runtime.commands.motion.waitformotiondone(axis_keys)
-        time.sleep(0.5)
-
-        move_name = 'SW_NE'
-        filename = f"stage_performance_{test_type}_{move_name}.dat"
-        
-        move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, list(ne_coords))
+        controller.runtime.commands.motion.waitforinposition(axis_keys)
 
-        axis_faults = check_for_faults(controller, all_axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
-
-        results['SW_NE'] = move_results
-
-        move_name = 'NE_SW'
-        filename = f"stage_performance_{test_type}_{move_name}.dat"
-        
-        move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, list(sw_coords))
-
-        axis_faults = check_for_faults(controller, all_axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
-
-        results['NE_SW'] = move_results
+        # Both legs of each diagonal run in one program and one data collection
+        diagonal_moves = [
+            ('SW_NE', ne_coords, stage_performance_dat_filename(test_type, 'SW_NE')),
+            ('NE_SW', sw_coords, stage_performance_dat_filename(test_type, 'NE_SW')),
+        ]
+        filename = stage_performance_dat_filename(test_type, 'SW_NE_SW')
+        results.update(run_stage_moves(controller, axis_keys, velocity, n, so_dir, sw_coords, diagonal_moves, filename, all_axes))
 
-        # Movement 2: SE → NW → SE
+        # Movement 2: SE → NW → SE, repositioning to SE outside the data collection
         print("📍 Move 2: SE → NW → SE")
         controller.runtime.commands.motion.moveabsolute(axis_keys, list(se_coords), velocity)
-        controller.runtime.commands.motion.waitformotiondone(axis_keys)
-        time.sleep(0.5)
-
-        move_name = 'SE_NW'
-        filename = f"stage_performance_{test_type}_{move_name}.dat"
-        
-        move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, list(nw_coords))
+        controller.runtime.commands.motion.waitforinposition(axis_keys)
 
-        axis_faults = check_for_faults(controller, all_axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
-
-        results['SE_NW'] = move_results
-
-        move_name = 'NW_SE'
-        filename = f"stage_performance_{test_type}_{move_name}.dat"
-        
-        move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, list(se_coords))
-
-        axis_faults = check_for_faults(controller, all_axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
-
-        results['NW_SE'] = move_results
+        diagonal_moves = [
+            ('SE_NW', nw_coords, stage_performance_dat_filename(test_type, 'SE_NW')),
+            ('NW_SE', se_coords, stage_performance_dat_filename(test_type, 'NW_SE')),
+        ]
+        filename = stage_performance_dat_filename(test_type, 'SE_NW_SE')
+        results.update(run_stage_moves(controller, axis_keys, velocity, n, so_dir, se_coords, diagonal_moves, filename, all_axes))
 
         # Return to center
         print("📍 Returning to center")
         controller.runtime.commands.motion.moveabsolute(axis_keys, list(center_coords), velocity)
-        controller.runtime.commands.motion.waitformotiondone(axis_keys)
-        time.sleep(1)
+        controller.runtime.commands.motion.waitforinposition(axis_keys)
 
-        axis_faults = check_for_faults(controller, all_axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
+        poll_faults(controller, all_axes)
 
         print("✅ Diagonal movement sequence completed")
 
     if test_type == 'single':
         axis_keys = list(axes_dict.keys())
         axis = axis_keys[0]   # First axis name
-        rev_motion = controller.runtime.parameters.axes[axis].motion.reversemotiondirection.value
+        # Walk to the runtime axis parameters once for both reads
+        runtime_axis = controller.runtime.parameters.axes[axis]
+        rev_motion = runtime_axis.motion.reversemotiondirection.value
         if rev_motion == 1:
             reverse_motion = True
         else:
             reverse_motion = False
             
-        units_value = controller.runtime.parameters.axes[axis].units.unitsname.value
+        units_value = runtime_axis.units.unitsname.value
         if units_value == 'deg':
             rotary = True
             
@@ -1974,64 +2271,37 @@ def validate_stage_performance(controller: a1.Controller, axes_dict: dict, test_
         controller.runtime.commands.motion.enable(all_axes)
         
         # Check for faults after enable
-        axis_faults = check_for_faults(controller, all_axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
+        decoded_faults = poll_faults(controller, all_axes)
+        if decoded_faults:
             print(f"❌ Faults detected after enable: {decoded_faults}")
         
         controller.runtime.commands.motion.home(axis)
         
         # Check for faults after homing
-        axis_faults = check_for_faults(controller, all_axes if all_axes else [axis])
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes if all_axes else [axis], controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
+        decoded_faults = poll_faults(controller, all_axes if all_axes else [axis])
+        if decoded_faults:
             print(f"❌ Faults detected after homing: {decoded_faults}")
         
-        controller.runtime.commands.motion.waitformotiondone([axis])
-        time.sleep(2)
+        controller.runtime.commands.motion.waitforinposition([axis])
         
-        axis_faults = check_for_faults(controller, all_axes)
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
+        poll_faults(controller, all_axes)
 
         # Execute diagonal movement sequence
         print("\n🔄 Executing diagonal movement sequence...")
 
         # Extract coordinates for the movements
-        neg_end = axis_limits[axis][0] + calculate_coordinate_offset(axis_limits, axis)
-        pos_end = axis_limits[axis][1] - calculate_coordinate_offset(axis_limits, axis)
+        neg_end, pos_end = calculate_inset_limits(axis_limits, {axis: 0.0}, [axis])[:, 0].tolist()
         
         center_coords = center
         velocity = [axes_dict[axis][0]]
 
         if rotary and axis_limits[axis][0] == 0 and axis_limits[axis][1] == 0:
             
-            move_name = 'Positive'
-            filename = f"stage_performance_{axis}_{move_name}.dat"
-            
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, distance)
+            # Both legs run in one program and one data collection
+            filename = stage_performance_dat_filename(test_type, 'PosNeg')
 
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
-
-            results['pos'] = move_results
-
-            move_name = 'Negative'
-            filename = f"stage_performance_{axis}_{move_name}.dat"
-            
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, [0])
-
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
-
-            results['neg'] = move_results
+            results.update(run_stage_moves(controller, axis_keys, velocity, n, so_dir, [0],
+                                           pos_neg_moves(test_type, distance, [0]), filename, all_axes))
         else:
             # Calculate center positions for each axis
             if reverse_motion:
@@ -2043,78 +2313,140 @@ def validate_stage_performance(controller: a1.Controller, axes_dict: dict, test_
             print("📍 Move 1: Negative to Positive")
             print(f" Axes = {axis}. Position = {neg_end}. Velocity = {velocity}")
             controller.runtime.commands.motion.moveabsolute(axis, [neg_end], velocity)
-            controller.runtime.commands.motion.waitformotiondone(axis)
-            time.sleep(0.5)
-
-            move_name = 'Positive'
-            filename = f"stage_performance_{axis}_{move_name}.dat"
-            
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, [pos_end])
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
-
-            results['pos'] = move_results
+            controller.runtime.commands.motion.waitforinposition(axis)
 
-            move_name = 'Negative'
-            filename = f"stage_performance_{axis}_{move_name}.dat"
-            
-            move_results = move_profile(controller, axis_keys, velocity, n, filename, so_dir, [neg_end])
-
-            axis_faults = check_for_faults(controller, all_axes)
-            if axis_faults:
-                fault_init = decode_faults(axis_faults, all_axes, controller, fault_log = None)
-                decoded_faults = fault_init.get_fault()
+            # Both legs run in one program and one data collection
+            filename = stage_performance_dat_filename(test_type, 'PosNeg')
 
-            results['neg'] = move_results
+            results.update(run_stage_moves(controller, axis_keys, velocity, n, so_dir, [neg_end],
+                                           pos_neg_moves(test_type, [pos_end], [neg_end]), filename, all_axes))
 
             # Return to center
             print("📍 Returning to center")
             controller.runtime.commands.motion.moveabsolute(axis, [center], velocity)
-            controller.runtime.commands.motion.waitformotiondone(axis)
-            time.sleep(1)
+            controller.runtime.commands.motion.waitforinposition(axis)
 
         print("✅ Movement sequence completed")
 
     return results
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _axis_performance_stats(pos_error, velocity, accel, current):
+    """
+    Single-axis performance statistics in two fused sweeps, without intermediate mask arrays.
+    All signals come from the same data collection, so they share one sample count.
+
+    Returns:
+        tuple: (peak_pos_error, current_const_vel, rms_accel)
+    """
+    n = min(pos_error.shape[0], velocity.shape[0], accel.shape[0], current.shape[0])
+
+    # Sweep 1 - running max of |x| for every signal at once
+    peak_pos_error = 0.0
+    vel_max = 0.0
+    accel_max = 0.0
+    for i in prange(n):
+        peak_pos_error = max(peak_pos_error, abs(pos_error[i]))
+        vel_max = max(vel_max, abs(velocity[i]))
+        accel_max = max(accel_max, abs(accel[i]))
+
+    # Sweep 2 - masked and unmasked sums for the current and acceleration statistics
+    # Constant velocity is where velocity change < 1% of max; acceleration is where accel > 10% of max
+    vel_threshold = 0.01 * vel_max
+    accel_threshold = 0.1 * accel_max
+    const_vel_sum = 0.0
+    const_vel_count = 0
+    current_sum = 0.0
+    accel_sum_sq = 0.0
+    accel_count = 0
+    accel_total_sq = 0.0
+    for i in prange(n):
+        current_sum += current[i]
+        accel_sq = accel[i] * accel[i]
+        accel_total_sq += accel_sq
+        if abs(accel[i]) > accel_threshold:
+            accel_sum_sq += accel_sq
+            accel_count += 1
+        if i > 0 and abs(velocity[i] - velocity[i - 1]) < vel_threshold:
+            const_vel_sum += current[i]
+            const_vel_count += 1
+
+    # Fall back to the whole-signal mean / RMS when the mask selects nothing
+    if const_vel_count > 0:
+        current_const_vel = const_vel_sum / const_vel_count
+    else:
+        current_const_vel = current_sum / n
+    if accel_count > 0:
+        rms_accel = math.sqrt(accel_sum_sq / accel_count)
+    else:
+        rms_accel = math.sqrt(accel_total_sq / n)
+
+    return peak_pos_error, current_const_vel, rms_accel
+
 def calculate_performance_stats(time_array, signal_data_dict, axis_names):
     """Calculate performance statistics from signal data"""
-    stats = {}
+    if NUMBA_AVAILABLE:
+        # JIT kernel fuses the threshold, masked mean and RMS passes per axis
+        stats = {}
+        for axis in axis_names:
+            peak_pos_error, current_const_vel, rms_accel = _axis_performance_stats(
+                np.ascontiguousarray(signal_data_dict['PosErr'][axis], dtype=np.float64),
+                np.ascontiguousarray(signal_data_dict['VelFbk'][axis], dtype=np.float64),
+                np.ascontiguousarray(signal_data_dict['AccFbk'][axis], dtype=np.float64),
+                np.ascontiguousarray(signal_data_dict['CurFbk'][axis], dtype=np.float64)
+            )
+            stats[axis] = {
+                'peak_pos_error': peak_pos_error,
+                'current_const_vel': current_const_vel,
+                'rms_accel': rms_accel
+            }
+        return stats
+
+    # Stack every axis into an (n_axes, n_samples) array so each statistic is one reduction across all axes
+    pos_error = np.asarray([signal_data_dict['PosErr'][axis] for axis in axis_names], dtype=np.float64)
+    velocity = np.asarray([signal_data_dict['VelFbk'][axis] for axis in axis_names], dtype=np.float64)
+    accel = np.asarray([signal_data_dict['AccFbk'][axis] for axis in axis_names], dtype=np.float64)
+    current = np.asarray([signal_data_dict['CurFbk'][axis] for axis in axis_names], dtype=np.float64)
+    
+    # |x| passes share one scratch buffer instead of allocating a temporary per signal
+    scratch = np.empty_like(pos_error)
+    
+    # Peak Position Error
+    peak_pos_error = np.abs(pos_error, out=scratch).max(axis=1)
+    
+    # Current during constant velocity (where velocity change < 1% of max)
+    vel_threshold = 0.01 * np.abs(velocity, out=scratch).max(axis=1)
+    const_vel_mask = np.abs(np.diff(velocity, axis=1)) < vel_threshold[:, None]
+    const_vel_count = const_vel_mask.sum(axis=1)
+    current_const_vel = np.where(
+        const_vel_count > 0,
+        np.where(const_vel_mask, current[:, 1:], 0.0).sum(axis=1) / np.maximum(const_vel_count, 1),
+        current.mean(axis=1)
+    )
+    
+    # RMS Acceleration during acceleration (where accel > 10% of max)
+    abs_accel = np.abs(accel, out=scratch)
+    accel_mask = abs_accel > (0.1 * abs_accel.max(axis=1))[:, None]
+    accel_count = accel_mask.sum(axis=1)
+    # Row-wise dot products give the sums of squares without a squared temporary
+    masked_accel = np.where(accel_mask, accel, 0.0)
+    rms_accel = np.sqrt(np.where(
+        accel_count > 0,
+        np.einsum('ij,ij->i', masked_accel, masked_accel) / np.maximum(accel_count, 1),
+        np.einsum('ij,ij->i', accel, accel) / accel.shape[1]
+    ))
     
-    for axis in axis_names:
-        stats[axis] = {}
-        
-        # Get signal data arrays using new signal names
-        pos_error = np.array(signal_data_dict['PosErr'][axis])
-        velocity = np.array(signal_data_dict['VelFbk'][axis])
-        accel = np.array(signal_data_dict['AccFbk'][axis])
-        current = np.array(signal_data_dict['CurFbk'][axis])
-        
-        # Peak Position Error
-        stats[axis]['peak_pos_error'] = np.max(np.abs(pos_error))
-        
-        # Current during constant velocity (where velocity change < 10% of max)
-        vel_threshold = 0.01 * np.max(np.abs(velocity))
-        vel_diff = np.abs(np.diff(velocity))
-        const_vel_mask = vel_diff < vel_threshold
-        if np.any(const_vel_mask):
-            stats[axis]['current_const_vel'] = np.mean((current[1:][const_vel_mask]))
-        else:
-            stats[axis]['current_const_vel'] = np.mean((current))
-            
-        # RMS Acceleration during acceleration (where accel > 10% of max)
-        accel_threshold = 0.1 * np.max(np.abs(accel))
-        accel_mask = np.abs(accel) > accel_threshold
-        if np.any(accel_mask):
-            stats[axis]['rms_accel'] = np.sqrt(np.mean(accel[accel_mask]**2))
-        else:
-            stats[axis]['rms_accel'] = np.sqrt(np.mean(accel**2))
+    stats = {}
+    for axis_idx, axis in enumerate(axis_names):
+        stats[axis] = {
+            'peak_pos_error': peak_pos_error[axis_idx],
+            'current_const_vel': current_const_vel[axis_idx],
+            'rms_accel': rms_accel[axis_idx]
+        }
     
     return stats
     
-def calculate_settle_time(time_array, velocity_command, position_error, controller, axis):
+def calculate_settle_time(time_array, velocity_command, position_error, in_position_distance, in_position_time, axis):
     """
     Calculate settle time based on InPositionDistance and InPositionTime parameters
     
@@ -2122,24 +2454,20 @@ def calculate_settle_time(time_array, velocity_command, position_error, controll
         time_array: Time data in seconds
         velocity_command: VelocityCommand signal data
         position_error: PositionError signal data
-        controller: Controller object to get parameters
+        in_position_distance: InPositionDistance parameter value for the axis
+        in_position_time: InPositionTime parameter value for the axis in milliseconds
         axis: Axis name
         
     Returns:
         settle_time: Time to settle in seconds, or None if not settled
     """
     try:
-        # Get in-position parameters from controller
-        in_position_distance = controller.runtime.parameters.axes[axis].motion.inpositiondistance.value
-        in_position_time = controller.runtime.parameters.axes[axis].motion.inpositiontime.value  # in milliseconds
         in_position_time_sec = in_position_time / 1000.0  # Convert to seconds
         
-        print(f"📐 Axis {axis}: InPositionDistance = {in_position_distance}, InPositionTime = {in_position_time}ms")
-        
-        # Convert to numpy arrays for easier processing
-        time_array = np.array(time_array)
-        velocity_command = np.array(velocity_command)
-        position_error = np.array(position_error)
+        # Convert to numpy arrays for easier processing (no copy when already float64 arrays)
+        time_array = np.asarray(time_array, dtype=np.float64)
+        velocity_command = np.asarray(velocity_command, dtype=np.float64)
+        position_error = np.asarray(position_error, dtype=np.float64)
         
         # Find the last occurrence of non-zero velocity command (end of move)
         non_zero_velocity_indices = np.where(np.abs(velocity_command) > 1e-6)[0]  # Small threshold for floating point
@@ -2211,7 +2539,79 @@ def calculate_settle_time(time_array, velocity_command, position_error, controll
         print(f"❌ Error calculating settle time for axis {axis}: {e}")
         return None
 
-def export_stage_performance_dat(results, test_type, axes_dict, move_name, axis_names):
+def get_signal_array(data, signal_key, cache):
+    """
+    Fetch a collected signal from a DatFile result as a float64 NumPy array
+    
+    Args:
+        data: DatFile result returned by move_profile
+        signal_key: Signal name followed by the axis name (e.g. 'PosErrX')
+        cache: Dictionary of arrays already converted for this move, keyed by signal_key
+        
+    Returns:
+        ndarray, or None if the signal was not collected
+    """
+    if signal_key not in cache:
+        if signal_key not in data.all_data:
+            return None
+        values = data.all_data[signal_key]
+        if isinstance(values, np.ndarray):
+            cache[signal_key] = np.asarray(values, dtype=np.float64)
+        else:
+            # Stream straight into a float64 buffer instead of copying through an intermediate list
+            cache[signal_key] = np.fromiter(values, dtype=np.float64, count=len(values))
+    return cache[signal_key]
+
+def get_signal_arrays(data, signal_keys, cache):
+    """
+    Fetch several collected signals from a DatFile result in one batched conversion
+    
+    Signals of equal length are converted together into one 2-D float64 block and
+    cached as row views; ragged signals fall back to get_signal_array one at a time.
+    
+    Args:
+        data: DatFile result returned by move_profile
+        signal_keys: Signal names followed by the axis name (e.g. ['PosErrX', 'PosErrY'])
+        cache: Dictionary of arrays already converted for this move, keyed by signal_key
+        
+    Returns:
+        list: The requested signal keys that were not collected
+    """
+    pending = [signal_key for signal_key in signal_keys if signal_key not in cache and signal_key in data.all_data]
+    if pending:
+        try:
+            block = np.array([data.all_data[signal_key] for signal_key in pending], dtype=np.float64)
+        except ValueError:
+            # Signals of different lengths cannot share one block
+            block = None
+        if block is not None and block.ndim == 2:
+            for signal_key, row in zip(pending, block):
+                cache[signal_key] = row
+        else:
+            for signal_key in pending:
+                get_signal_array(data, signal_key, cache)
+    return [signal_key for signal_key in signal_keys if signal_key not in cache]
+
+# Data collection sample period for the stage performance moves (1 kHz)
+STAGE_PERFORMANCE_SAMPLE_PERIOD_S = 0.001
+
+@lru_cache(maxsize=16)
+def get_time_array(num_samples):
+    """
+    Time base for a stage performance move, shared by every signal and move of the same length
+    
+    Args:
+        num_samples: Number of collected samples
+        
+    Returns:
+        ndarray: Read-only float64 time array in seconds, exactly num_samples long
+    """
+    # Scale an integer ramp rather than using a float step, which can overshoot by one sample
+    time_array = np.arange(num_samples, dtype=np.float64) * STAGE_PERFORMANCE_SAMPLE_PERIOD_S
+    time_array.flags.writeable = False
+    return time_array
+
+def export_stage_performance_dat(results, test_type, axes_dict, move_name, axis_names, signal_cache=None):
     """
     Export stage performance data to .dat file format (Aerotech data collection format)
     
@@ -2221,17 +2621,19 @@ def export_stage_performance_dat(results, test_type, axes_dict, move_name, axis_
         axes_dict: Dictionary of axis parameters
         move_name: Name of the move (e.g., 'SW_NE', 'pos', etc.)
         axis_names: List of axis names
+        signal_cache: Optional per-move dictionary of converted signal arrays to reuse
     """
     try:
         data = results[move_name]
+        if signal_cache is None:
+            signal_cache = {}
         
         # Create time array using the same method as in plot function
-        SAMPLE_PERIOD_S = 0.001
         first_axis = axis_names[0]
         pos_fbk_key = f'PosFbk{first_axis}'
         if pos_fbk_key in data.all_data:
             num_samples = len(data.all_data[pos_fbk_key])
-            time_array = np.arange(0, num_samples * SAMPLE_PERIOD_S, SAMPLE_PERIOD_S)
+            time_array = get_time_array(num_samples)
         else:
             print(f"⚠️ Could not find {pos_fbk_key} in data for {move_name}")
             return None
@@ -2256,9 +2658,9 @@ def export_stage_performance_dat(results, test_type, axes_dict, move_name, axis_
             for axis in axis_names:
                 try:
                     signal_key = f'{signal_type}{axis}'
-                    if signal_key in data.all_data:
-                        data_points = data.all_data[signal_key][:]
-                        signal_data[signal_name][axis] = np.array(data_points)
+                    data_points = get_signal_array(data, signal_key, signal_cache)
+                    if data_points is not None:
+                        signal_data[signal_name][axis] = data_points
                     else:
                         print(f"⚠️ Could not find {signal_key} in data for {move_name}")
                         # Fill with zeros if signal not available
@@ -2319,6 +2721,170 @@ def export_stage_performance_dat(results, test_type, axes_dict, move_name, axis_
         print(f"❌ Error exporting .dat file for {move_name}: {e}")
         return None
 
+# Plot titles for each validation move
+STAGE_PERFORMANCE_MOVE_TITLES = {
+    'SW_NE': "Southwest to Northeast Move",
+    'NE_SW': "Northeast to Southwest Move", 
+    'SE_NW': "Southeast to Northwest Move",
+    'NW_SE': "Northwest to Southeast Move",
+    'pos': "Positive Direction Move",
+    'neg': "Negative Direction Move"
+}
+
+def build_stage_performance_plot(move_name, move_signals, num_samples, filename, plot_settings):
+    """
+    Build and save the stacked signal plot for one stage performance move
+
+    Runs on a worker thread and never touches the controller, so every argument is plain data.
+
+    Args:
+        move_name: Name of the move (e.g., 'SW_NE', 'pos', etc.)
+        move_signals: Dictionary of float64 signal arrays keyed by signal name and axis (e.g. 'PosErrX')
+        num_samples: Number of collected samples in the move
+        filename: Output HTML path
+        plot_settings: Dictionary of layout and parameter data shared by every move
+
+    Returns:
+        str: The saved filename
+    """
+    axis_names = plot_settings['axis_names']
+    signals = plot_settings['signals']
+    axis_colors = plot_settings['axis_colors']
+    primary_units = plot_settings['primary_units']
+    time_array = get_time_array(num_samples)
+
+    # Create subplots - 5 rows per axis, 1 column (stacked)
+    fig = make_subplots(
+        rows=plot_settings['total_rows'], cols=1,
+        shared_xaxes=True,
+        subplot_titles=plot_settings['subplot_titles'],
+        vertical_spacing=0.02
+    )
+
+    # Initialize signal data storage for stats
+    signal_data_dict = {}
+    for signal_type, plot_title, y_axis_label in signals:
+        signal_data_dict[signal_type] = {}
+
+    # Also keep VelocityCommand for settle time calculation (not plotted)
+    signal_data_dict['VelCmd'] = {}
+
+    # Traces are collected as plain dicts and added in one call, skipping per-trace validation
+    traces = []
+
+    # Fixed axis ranges from the data we already hold, so the browser skips the autorange pass
+    axis_ranges = {}
+    if num_samples > 0:
+        x_range = [float(time_array[0]), float(time_array[-1])]
+        for row in range(1, plot_settings['total_rows'] + 1):
+            axis_ranges[f"xaxis{'' if row == 1 else row}_range"] = x_range
+
+    # Plot each signal for each axis - group by axis
+    for axis_idx, axis in enumerate(axis_names):
+        for signal_idx, (signal_type, plot_title, y_axis_label) in enumerate(signals):
+            signal_array = move_signals.get(f'{signal_type}{axis}')
+            if signal_array is None:
+                signal_data_dict[signal_type][axis] = []
+                continue
+
+            # Store signal data for stats calculation
+            signal_data_dict[signal_type][axis] = signal_array
+
+            # Calculate row number: (axis_index * 5) + signal_index + 1
+            row_num = (axis_idx * 5) + signal_idx + 1
+
+            # Add trace to the appropriate subplot (axis ids are 'x', 'x2', ... per row)
+            axis_suffix = '' if row_num == 1 else str(row_num)
+            traces.append({
+                'type': 'scatter',
+                'x': time_array,
+                'y': signal_array,
+                'name': f'{axis} {signal_type}',
+                'line': {'color': axis_colors[axis_idx % len(axis_colors)]},
+                'showlegend': row_num == 1,
+                'xaxis': f'x{axis_suffix}',
+                'yaxis': f'y{axis_suffix}'
+            })
+
+            # Pad the y range by 5% (or a fixed amount for a flat signal); leave non-finite data on autorange
+            if signal_array.size:
+                y_min, y_max = float(signal_array.min()), float(signal_array.max())
+                if math.isfinite(y_min) and math.isfinite(y_max):
+                    margin = 0.05 * (y_max - y_min) if y_max > y_min else max(0.05 * abs(y_max), 1e-9)
+                    axis_ranges[f'yaxis{axis_suffix}_range'] = [y_min - margin, y_max + margin]
+
+        velocity_command_data = move_signals.get(f'VelCmd{axis}')
+        signal_data_dict['VelCmd'][axis] = velocity_command_data if velocity_command_data is not None else []
+
+    fig.add_traces(traces)
+
+    # Calculate performance statistics
+    try:
+        stats = calculate_performance_stats(time_array, signal_data_dict, axis_names)
+
+        # Calculate settle times for each axis
+        settle_times = {}
+        for axis in axis_names:
+            in_position = plot_settings['in_position'].get(axis)
+            if in_position is not None:
+                settle_times[axis] = calculate_settle_time(
+                    time_array,
+                    signal_data_dict['VelCmd'][axis],
+                    signal_data_dict['PosErr'][axis],
+                    in_position[0],
+                    in_position[1],
+                    axis
+                )
+            else:
+                settle_times[axis] = None
+
+        # Create stats table text
+        stats_text = f"<b>Performance Statistics ({move_name.upper()})</b><br><br>"
+        for axis in axis_names:
+            stats_text += f"<b>{axis} Axis:</b><br>"
+            stats_text += f"• Peak Pos Error: {stats[axis]['peak_pos_error']:.7f} {primary_units}<br>"
+            stats_text += f"• Current @ Const Vel: {stats[axis]['current_const_vel']:.4f}A<br>"
+            stats_text += f"• RMS Accel: {stats[axis]['rms_accel']:.4f} {primary_units}/s²<br>"
+
+            # Add settle time
+            if settle_times[axis] is not None:
+                stats_text += f"• Settle Time: {settle_times[axis]:.3f}s<br><br>"
+            else:
+                stats_text += f"• Settle Time: Not calculated<br><br>"
+
+        # Add stats table as annotation (appended after the subplot title annotations)
+        fig.layout.annotations += ({
+            'x': 0.98, 'y': 0.98,
+            'xref': "paper", 'yref': "paper",
+            'text': stats_text,
+            'showarrow': False,
+            'bgcolor': "lightblue",
+            'bordercolor': "black",
+            'borderwidth': 1,
+            'font': {'size': 10},
+            'align': "left",
+            'xanchor': "right",
+            'yanchor': "top"
+        },)
+    except Exception as e:
+        print(f"⚠️  Could not calculate stats for {move_name}: {e}")
+
+    # Create descriptive title based on test type
+    title_detail = STAGE_PERFORMANCE_MOVE_TITLES.get(move_name, move_name)
+
+    # Update layout and every axis label in one call
+    fig.update_layout(
+        title=f"Stage Performance Analysis ({plot_settings['test_type'].upper()}): {title_detail}",
+        height=2000,  # Much taller for better plot visibility
+        showlegend=False,  # Remove legend since each subplot is clearly labeled
+        **plot_settings['axis_title_layout'],
+        **axis_ranges
+    )
+
+    # Reference one shared plotly.min.js in the output folder instead of embedding the bundle in every file
+    fig.write_html(filename, include_plotlyjs='directory', include_mathjax=False, validate=False)
+    return filename
+
 def plot_stage_performance_results(results, test_type, axes_dict, controller):
     """
     Create Plotly plots for stage performance data with 5 stacked signal plots
@@ -2381,191 +2947,97 @@ def plot_stage_performance_results(results, test_type, axes_dict, controller):
     print(f"📋 Expected moves: {expected_moves}")
     print(f"📋 Available moves: {available_moves}")
     
-    # Create plots for each move
-    for move_name, data in results.items():
-        print(f"📈 Processing {move_name} data...")
-        SAMPLE_PERIOD_S = 0.001
+    # Layout pieces shared by every move's figure
+    total_rows = 5 * len(axis_names)
+    subplot_titles = [f"{axis} {signal[1]}" for axis in axis_names for signal in signals]
+    axis_title_layout = {}
+    for row in range(1, total_rows + 1):
+        axis_suffix = '' if row == 1 else str(row)
+        # Only show the time label on the very bottom plot
+        axis_title_layout[f'xaxis{axis_suffix}_title_text'] = "Time [s]" if row == total_rows else ""
+        axis_title_layout[f'yaxis{axis_suffix}_title_text'] = signals[(row - 1) % 5][2]
+    
+    # Read the in-position parameters up front so the plot workers never touch the controller
+    in_position = {}
+    for axis in axis_names:
         try:
-            # Get the number of samples from any available data signal
-            # Use the first axis to get sample count
-            first_axis = axis_names[0]
-            pos_fbk_key = f'PosFbk{first_axis}'
-            if pos_fbk_key in data.all_data:
-                num_samples = len(data.all_data[pos_fbk_key])
-                # Create the time array using np.arange(start, stop, step)
-                time_array = np.arange(0, num_samples * SAMPLE_PERIOD_S, SAMPLE_PERIOD_S)
-                time_array = time_array.tolist()
-            else:
-                print(f"⚠️ Could not find {pos_fbk_key} in data for {move_name}")
-                continue
-
+            in_position_distance = controller.runtime.parameters.axes[axis].motion.inpositiondistance.value
+            in_position_time = controller.runtime.parameters.axes[axis].motion.inpositiontime.value  # in milliseconds
+            in_position[axis] = (in_position_distance, in_position_time)
+            print(f"📐 Axis {axis}: InPositionDistance = {in_position_distance}, InPositionTime = {in_position_time}ms")
         except Exception as e:
-            print(f"⚠️  Could not generate time array for {move_name}: {e}")
-            time_array = []
+            print(f"⚠️ Could not get in-position parameters for axis {axis}: {e}")
+            in_position[axis] = None
+
+    plot_settings = {
+        'test_type': test_type,
+        'axis_names': axis_names,
+        'signals': signals,
+        'axis_colors': axis_colors,
+        'primary_units': primary_units,
+        'total_rows': total_rows,
+        'subplot_titles': subplot_titles,
+        'axis_title_layout': axis_title_layout,
+        'in_position': in_position
+    }
+
+    # Copy each move's signals out of the result as plain float64 arrays for the plot workers
+    plot_jobs = []
+    for move_name, data in results.items():
+        print(f"📈 Processing {move_name} data...")
+        # Get the number of samples from the first axis position feedback
+        pos_fbk_key = f'PosFbk{axis_names[0]}'
+        if pos_fbk_key not in data.all_data:
+            print(f"⚠️ Could not find {pos_fbk_key} in data for {move_name}")
             continue
-        
-        # Create subplots - 5 rows per axis, 1 column (stacked)
-        total_rows = 5 * len(axis_names)
-        fig = make_subplots(
-            rows=total_rows, cols=1,
-            shared_xaxes=True,
-            subplot_titles=[f"{axis} {signal[1]}" for axis in axis_names for signal in signals],
-            vertical_spacing=0.02
-        )
-        
-        # Initialize signal data storage for stats
-        signal_data_dict = {}
-        for signal_type, plot_title, y_axis_label in signals:
-            signal_data_dict[signal_type] = {}
-        
-        # Also extract VelocityCommand for settle time calculation (not plotted)
-        signal_data_dict['VelCmd'] = {}
+        num_samples = len(data.all_data[pos_fbk_key])
 
-        # Plot each signal for each axis - group by axis
-        for axis_idx, axis in enumerate(axis_names):
-            for signal_idx, (signal_type, plot_title, y_axis_label) in enumerate(signals):
-                try:
-                    # Get data for this axis and signal using the new format
-                    signal_key = f'{signal_type}{axis}'
-                    if signal_key in data.all_data:
-                        signal_array = data.all_data[signal_key][:]
-                        
-                        # Store signal data for stats calculation
-                        signal_data_dict[signal_type][axis] = signal_array
-                        
-                        # Calculate row number: (axis_index * 5) + signal_index + 1
-                        row_num = (axis_idx * 5) + signal_idx + 1
-                        
-                        # Add trace to the appropriate subplot
-                        fig.add_trace(
-                            go.Scatter(
-                                x=time_array, 
-                                y=signal_array, 
-                                name=f'{axis} {signal_type}',
-                                line=dict(color=axis_colors[axis_idx % len(axis_colors)]),
-                                showlegend=(row_num == 1)
-                            ),
-                            row=row_num, col=1
-                        )
-                    else:
-                        print(f"⚠️ Could not find {signal_key} in data for {move_name}")
-                        signal_data_dict[signal_type][axis] = []
-                    
-                except Exception as e:
-                    print(f"⚠️  Could not extract {signal_type} data for axis {axis}: {e}")
-                    signal_data_dict[signal_type][axis] = []
-                    continue
-        
-        # Extract VelocityCommand for settle time calculation
-        for axis in axis_names:
-            try:
-                vel_cmd_key = f'VelCmd{axis}'
-                if vel_cmd_key in data.all_data:
-                    velocity_command_data = data.all_data[vel_cmd_key][:]
-                    signal_data_dict['VelCmd'][axis] = velocity_command_data
-                else:
-                    print(f"⚠️ Could not find {vel_cmd_key} in data for {move_name}")
-                    signal_data_dict['VelCmd'][axis] = []
-            except Exception as e:
-                print(f"⚠️  Could not extract VelCmd data for axis {axis}: {e}")
-                signal_data_dict['VelCmd'][axis] = []
-        
-        # Calculate performance statistics
+        move_signals = {}
+        signal_keys = [f'{signal_type}{axis}' for axis in axis_names for signal_type in [signal[0] for signal in signals] + ['VelCmd']]
         try:
-            stats = calculate_performance_stats(time_array, signal_data_dict, axis_names)
-            
-            # Calculate settle times for each axis
-            settle_times = {}
-            for axis in axis_names:
-                if ('VelCmd' in signal_data_dict and axis in signal_data_dict['VelCmd'] and
-                    'PosErr' in signal_data_dict and axis in signal_data_dict['PosErr']):
-                    settle_time = calculate_settle_time(
-                        time_array,
-                        signal_data_dict['VelCmd'][axis],
-                        signal_data_dict['PosErr'][axis],
-                        controller,
-                        axis
-                    )
-                    settle_times[axis] = settle_time
-                else:
-                    settle_times[axis] = None
-            
-            # Create stats table text
-            stats_text = f"<b>Performance Statistics ({move_name.upper()})</b><br><br>"
-            for axis in axis_names:
-                stats_text += f"<b>{axis} Axis:</b><br>"
-                stats_text += f"• Peak Pos Error: {stats[axis]['peak_pos_error']:.7f} {primary_units}<br>"
-                stats_text += f"• Current @ Const Vel: {stats[axis]['current_const_vel']:.4f}A<br>"
-                stats_text += f"• RMS Accel: {stats[axis]['rms_accel']:.4f} {primary_units}/s²<br>"
-                
-                # Add settle time
-                if settle_times[axis] is not None:
-                    stats_text += f"• Settle Time: {settle_times[axis]:.3f}s<br><br>"
-                else:
-                    stats_text += f"• Settle Time: Not calculated<br><br>"
-            
-            # Add stats table as annotation
-            fig.add_annotation(
-                x=0.98, y=0.98,
-                xref="paper", yref="paper",
-                text=stats_text,
-                showarrow=False,
-                bgcolor="lightblue",
-                bordercolor="black",
-                borderwidth=1,
-                font=dict(size=10),
-                align="left",
-                xanchor="right",  
-                yanchor="top"
-            )
+            for signal_key in get_signal_arrays(data, signal_keys, move_signals):
+                print(f"⚠️ Could not find {signal_key} in data for {move_name}")
         except Exception as e:
-            print(f"⚠️  Could not calculate stats for {move_name}: {e}")
-        
-        # Create descriptive title based on test type
-        if test_type == 'multi':
-            title_details = {
-                'SW_NE': "Southwest to Northeast Move",
-                'NE_SW': "Northeast to Southwest Move", 
-                'SE_NW': "Southeast to Northwest Move",
-                'NW_SE': "Northwest to Southeast Move"
-            }
-            title_detail = title_details.get(move_name, move_name)
-        else:  # single
-            title_details = {
-                'pos': "Positive Direction Move",
-                'neg': "Negative Direction Move"
-            }
-            title_detail = title_details.get(move_name, move_name)
-        
-        # Update layout
-        fig.update_layout(
-            title=f'Stage Performance Analysis ({test_type.upper()}): {title_detail}',
-            height=2000,  # Much taller for better plot visibility
-            showlegend=False  # Remove legend since each subplot is clearly labeled
-        )
-        
-        # Update x-axis labels (only show time label on the very bottom plot)
-        for axis_idx in range(len(axis_names)):
-            for row in range(1, 6):
-                actual_row = (axis_idx * 5) + row
-                if axis_idx == len(axis_names) - 1 and row == 5:  # Only the very bottom subplot
-                    fig.update_xaxes(title_text="Time [s]", row=actual_row, col=1)
-                else:
-                    fig.update_xaxes(title_text="", row=actual_row, col=1)
-        
-        # Update y-axis labels
-        for axis_idx, axis in enumerate(axis_names):
-            for signal_idx, (signal_type, plot_title, y_axis_label) in enumerate(signals):
-                actual_row = (axis_idx * 5) + signal_idx + 1
-                fig.update_yaxes(title_text=y_axis_label, row=actual_row, col=1)
-        
-        # Save plot with descriptive filename
+            print(f"⚠️  Could not extract signal data for {move_name}: {e}")
+
         filename = os.path.join(so_dir, 'Performance Analysis', f"stage_performance_{plot_prefix}_{move_name}.html")
-        pyo.plot(fig, filename=filename, auto_open=False)
-        print(f"✅ Saved plot: {filename}")
-    
+        plot_jobs.append((move_name, move_signals, num_samples, filename))
+
+    # Each move builds an independent figure, so build them on worker threads. Threads share the
+    # compiled numba functions and keep the workers' settle/stats messages on this process's console.
+    if plot_jobs:
+        with ThreadPoolExecutor(max_workers=min(4, len(plot_jobs))) as executor:
+            futures = {
+                executor.submit(build_stage_performance_plot, move_name, move_signals, num_samples, filename, plot_settings): move_name
+                for move_name, move_signals, num_samples, filename in plot_jobs
+            }
+            for future, move_name in futures.items():
+                try:
+                    print(f"✅ Saved plot: {future.result()}")
+                except Exception as e:
+                    print(f"❌ Could not create plot for {move_name}: {e}")
+
     print(f"✅ All {test_type} axis stage performance plots and .dat files created.")
 
+def get_fr_log_filepath(fr_filepath):
+    """Log file path for an FR file: same base name, saved in the output folder"""
+    return os.path.join(so_dir, os.path.splitext(os.path.basename(fr_filepath))[0] + '.log')
+
+@contextlib.contextmanager
+def buffered_log(log_filepath, mode='w'):
+    """Collect a block's log output in memory and write it to log_filepath in one call when the block exits"""
+    log_buffer = io.StringIO()
+    try:
+        yield log_buffer
+    finally:
+        with open(log_filepath, mode, encoding='utf-8') as log_file:
+            log_file.write(log_buffer.getvalue())
+
+def print_fr_log_header(fr_filepath, log_file=None):
+    """Print the header that opens each FR file's optimization log"""
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    print(f"🔍 Processing FR file: {os.path.basename(fr_filepath)}\n📅 Timestamp: {timestamp}\n{'=' * 60}", file=log_file)
+
 def init_fr(all_axes=None, test_type=None, axes=None, controller=None, init_current=None, axes_params=None, performance_target=None):
     global so_dir
     
@@ -2591,11 +3063,7 @@ def init_fr(all_axes=None, test_type=None, axes=None, controller=None, init_curr
         controller.runtime.commands.motion.enable(all_axes)
         controller.runtime.commands.motion.home(axis)
 
-        axis_faults = check_for_faults(controller, axes if axes else [axis])
-
-        if axis_faults:
-            fault_init = decode_faults(axis_faults, axes, controller, fault_log = None)
-            decoded_faults = fault_init.get_fault()
+        decoded_faults = poll_faults(controller, axes if axes else [axis])
         if decoded_faults in ('OverCurrentFault', 'PositionErrorFault'):
             messagebox.showerror('OverCurrentFault', 'OverCurrentFault detected. Increasing Gain k')
             params = controller.configuration.parameters.get_configuration()
@@ -2608,15 +3076,12 @@ def init_fr(all_axes=None, test_type=None, axes=None, controller=None, init_curr
             init_fr(all_axes, test_type, axes, controller, init_current, axes_params)
         # Get travel limits for both axes
         axis_limits = {}
-        rev_motion = controller.runtime.parameters.axes[axis].motion.reversemotiondirection.value
-        if rev_motion == 1:
-            reverse_motion = True
-        else:
-            reverse_motion = False
+        params_snapshot = snapshot_axis_parameters(controller, [axis])
+        reverse_motion = params_snapshot[axis]['reverse_motion']
             
-        pos_limit = controller.runtime.parameters.axes[axis].protection.softwarelimithigh.value
-        neg_limit = controller.runtime.parameters.axes[axis].protection.softwarelimitlow.value
-        units_value = controller.runtime.parameters.axes[axis].units.unitsname.value
+        pos_limit = params_snapshot[axis]['soft_limit_high']
+        neg_limit = params_snapshot[axis]['soft_limit_low']
+        units_value = params_snapshot[axis]['units']
         units.append(units_value)
         axis_limits[axis] = (neg_limit, pos_limit)
         
@@ -2640,7 +3105,7 @@ def init_fr(all_axes=None, test_type=None, axes=None, controller=None, init_curr
         position = 'Center Init'
 
         fr_files = {}
-        fr_filepath, _ = frequency_response(axis, controller, init_current, verification=False, position=position, axes=all_axes)
+        fr_filepath, _ = frequency_response(axis, controller, init_current, verification=False, position=position, axes=all_axes, axis_params=params_snapshot[axis])
         fr_files[axis] = fr_filepath
 
     elif test_type == 'multi':
@@ -2666,16 +3131,13 @@ def init_fr(all_axes=None, test_type=None, axes=None, controller=None, init_curr
         # Get travel limits for both axes
         axis_limits = {}
         reverse_motion = {}
+        params_snapshot = snapshot_axis_parameters(controller, axes)
         for axis in axes:
-            rev_motion = controller.runtime.parameters.axes[axis].motion.reversemotiondirection.value
-            if rev_motion == 1:
-                reverse_motion[axis] = True
-            else:
-                reverse_motion[axis] = False
+            reverse_motion[axis] = params_snapshot[axis]['reverse_motion']
                 
-            pos_limit = controller.runtime.parameters.axes[axis].protection.softwarelimithigh.value
-            neg_limit = controller.runtime.parameters.axes[axis].protection.softwarelimitlow.value
-            units_value = controller.runtime.parameters.axes[axis].units.unitsname.value
+            pos_limit = params_snapshot[axis]['soft_limit_high']
+            neg_limit = params_snapshot[axis]['soft_limit_low']
+            units_value = params_snapshot[axis]['units']
             units.append(units_value)
             axis_limits[axis] = (neg_limit, pos_limit)
 
@@ -2701,19 +3163,16 @@ def init_fr(all_axes=None, test_type=None, axes=None, controller=None, init_curr
 
         fr_files = {}
         for axis in axes:
-            fr_filepath, _ = frequency_response(axis, controller, init_current, verification=False, position=position, axes=axes)
+            fr_filepath, _ = frequency_response(axis, controller, init_current, verification=False, position=position, axes=axes, axis_params=params_snapshot[axis])
             fr_files[axis] = fr_filepath
 
-    iteration = 1
     log_files = []
     # Process each FR file with individual logging
     for axis, fr_filepath in fr_files.items():
-        log_filepath = os.path.join(so_dir, os.path.splitext(os.path.basename(fr_filepath))[0] + '.log')
-        with open(log_filepath, 'w', encoding='utf-8') as log_file:
+        log_filepath = get_fr_log_filepath(fr_filepath)
+        with buffered_log(log_filepath) as log_file:
             with contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
-                print(f"🔍 Processing FR file: {os.path.basename(fr_filepath)}")
-                print(f"📅 Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                print("="*60)
+                print_fr_log_header(fr_filepath)
                 
                 # Step 2: EasyTune Optimization
                 print("\n🎯 STEP 2: EasyTune Optimization")
@@ -2730,35 +3189,47 @@ def verify_fr(all_axes=None, test_type=None, axes=None, controller=None, log_fil
 
     fr_files = []
     ver_failed = False  # Initialize before the loop
-
-    # Step 4: Verification Frequency Response
-    print("\n🔍 STEP 4: Verification Frequency Response")
-    if test_type == 'single':
-        axis = axes
-        fr_files = single_axis_frequency_response(axis, controller, ver_current, all_axes=all_axes)
-    elif test_type == 'multi':
-        axes = list(axes)
-        fr_files = multi_axis_frequency_response(axes, controller, ver_current, all_axes=all_axes)
-    print("✅ Verification Frequency Response Completed")
-    time.sleep(2)
+    # Filters written during this verification pass, so a position repeating them skips the write
+    applied_filters = {}
     
-    # Process each FR file with individual logging
-    for fr_filepath in fr_files:
+    # Each FR file is optimized on a background thread while the next position is acquired.
+    # optimize() writes to the file's log explicitly, so the acquisition thread keeps the console.
+    optimize_jobs = []
+    
+    def run_optimize(fr_filepath, position, log_filepath):
+        with buffered_log(log_filepath) as log_file:
+            print_fr_log_header(fr_filepath, log_file)
+            return optimize(fr_filepath=fr_filepath, verification=True, position=position, performance_target=performance_target, log_file=log_file)
+    
+    def submit_optimize(fr_filepath):
         # Extract axis name and position from filename
         # Filename format is 'test-{axis}-{position}-Verification.fr'
         filename = os.path.basename(fr_filepath)
         parts = filename.split('-')  # Split into ['test', '{axis}', '{position}', 'Verification.fr']
         current_axis = parts[1]  # Get the axis name part
         position = parts[2]  # Get the position part
-    
-        log_filepath = os.path.join(so_dir, os.path.splitext(os.path.basename(fr_filepath))[0] + '.log')
+        
+        log_filepath = get_fr_log_filepath(fr_filepath)
         print(f"🔍 Processing FR file: {os.path.basename(fr_filepath)}. Please wait...")
-        with open(log_filepath, 'w', encoding='utf-8') as log_file:
+        optimize_jobs.append((fr_filepath, current_axis, log_filepath, executor.submit(run_optimize, fr_filepath, position, log_filepath)))
+
+    # Step 4: Verification Frequency Response
+    print("\n🔍 STEP 4: Verification Frequency Response")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if test_type == 'single':
+            axis = axes
+            fr_files = single_axis_frequency_response(axis, controller, ver_current, all_axes=all_axes, fr_callback=submit_optimize)
+        elif test_type == 'multi':
+            axes = list(axes)
+            fr_files = multi_axis_frequency_response(axes, controller, ver_current, all_axes=all_axes, fr_callback=submit_optimize)
+        print("✅ Verification Frequency Response Completed")
+        time.sleep(2)
+    
+    # All optimizations are finished here, so parameters are applied from the main thread only
+    for fr_filepath, current_axis, log_filepath, optimize_job in optimize_jobs:
+        results, stability_passed, ff_analysis_data, sensitivity = optimize_job.result()
+        with buffered_log(log_filepath, 'a') as log_file:
             with contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
-                print(f"🔍 Processing FR file: {os.path.basename(fr_filepath)}")
-                print(f"📅 Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-                print("="*60)
-                results, stability_passed, ff_analysis_data, sensitivity = optimize(fr_filepath=fr_filepath, verification=True, position=position, performance_target=performance_target)
                 if stability_passed:
                     print("🎉 OPTIMIZATION PASSED - Stability criteria met!")
                     print("✅ Process completed successfully")
@@ -2767,7 +3238,8 @@ def verify_fr(all_axes=None, test_type=None, axes=None, controller=None, log_fil
                         print("❌ OPTIMIZATION FAILED - Stability criteria not met for this coordinate!")
                         ver_failed = ver_failed or True  # Use OR to maintain failed state
                         if results:
-                            success = apply_new_servo_params(current_axis, results, controller, ff_analysis_data, verification=True)
+                            success = apply_new_servo_params(current_axis, results, controller, ff_analysis_data, verification=True,
+                                                             applied_filters=applied_filters)
                         
         print("✅ Process completed successfully")
         log_files.append(log_filepath)
@@ -2890,18 +3362,15 @@ def cleanup_controller(controller, test_type):
 
     # Clean up files from controller
     print("🧹 Cleaning up controller files...")
-    try:
-        # Delete all performance analysis data files
-        for move_name in ['SW_NE', 'NE_SW', 'SE_NW', 'NW_SE', 'Positive', 'Negative']:
-            data_filename = f"stage_performance_{test_type}_{move_name}.dat"
-            controller.files.delete(data_filename)
-            print(f"✅ Deleted {data_filename}")
-        
-        # Delete the Move.ascript file
-        controller.files.delete('Move.ascript')
-        print("✅ Deleted Move.ascript")
-    except Exception as e:
-        print(f"⚠️ Warning: Could not delete some files from controller: {e}")
+    # Delete the performance analysis data files and programs; only some exist for a given run
+    # (the per-move files and Move.ascript only after a sequence falls back to move_profile)
+    data_filenames = [stage_performance_dat_filename(test_type, move_name) for move_name in STAGE_PERFORMANCE_DAT_MOVES]
+    for filename in data_filenames + ['MoveSequence.ascript', 'Move.ascript']:
+        try:
+            controller.files.delete(filename)
+            print(f"✅ Deleted {filename}")
+        except Exception as e:
+            print(f"ℹ️ Could not delete {filename} (not created this run?): {e}")
 
 def calculate_coordinate_offset(axis_limits, axis):
     """Calculate a relative offset based on the axis range for unit-agnostic positioning"""
@@ -2971,7 +3440,7 @@ def main(test=None, controller=None, axes=None, test_type=None, all_axes=None, u
             mcd_path = filedialog.askopenfilename(
                 title="Select MCD file to modify",
                 filetypes=[("MCD files", "*.mcd"), ("All files", "*.*")],
-                initialdir=os.path.join(f"C:\\Users\\{os.getlogin()}\\Documents\\Automation1")
+                initialdir=AUTOMATION1_DIR
             )
 
             # no_load_dir_path = os.path.dirname(mcd_path)
@@ -3201,6 +3670,7 @@ if __name__ == "__main__":
     parser.add_argument('--axis-limits', type=str, default=None, help='Axis limits as a string, e.g. "{\'X\':(-10,10),\'Y\':(-10,10)}"')
     parser.add_argument('--all-axes', type=str, default=None, help='All axes as a list string, e.g. "[\'X\',\'Y\']"')
     args = parser.parse_args()
+    logger.setLevel(logging.DEBUG)
 
     if args.validate_only:
         if args.axes_dict:
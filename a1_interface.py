@@ -913,7 +913,6 @@ def run_easy_tune(block_layout:Block_Layout.Block_Layout, data:FrequencyResponse
         generation_log = result.GenerationLog
 
         # Make log directory if it does not already exist.
-        username = os.getlogin()
         working_directory = os.path.join(f"O:\\EasyTune Plus Analysis", "EasyTune Logs")
         if not os.path.exists(working_directory):
             os.makedirs(working_directory)